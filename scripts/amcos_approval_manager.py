@@ -4,10 +4,11 @@ amcos_approval_manager.py - Dual-Authority Approval Manager for AMCOS
 
 Manages GovernanceRequests using a dual-authority model:
   PRIMARY:   AI Maestro REST API (/api/v1/governance/requests) — source of truth
-  SECONDARY: Local YAML files (.claude/approvals/) — audit trail and offline cache
+  SECONDARY: Local JSON mirror files (.claude/approvals/) — audit trail and offline cache
 
 When both are available, API state always wins. When the API is unreachable,
-local YAML keeps working with degraded authority (warnings emitted).
+the local mirror keeps working with degraded authority (warnings emitted).
+Mirrors written by older versions as YAML are migrated to JSON on first read.
 
 Part of the ai-maestro-chief-of-staff plugin.
 
@@ -21,14 +22,16 @@ Usage:
 """
 
 import argparse
+import functools
+import http.client
 import json
+import operator
 import os
 import subprocess
 import sys
+import threading
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -36,6 +39,11 @@ from typing import Any, Optional
 
 from amcos_output_utils import AmcosOutput
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -44,9 +52,48 @@ APPROVALS_DIR = ".claude/approvals"
 PENDING_DIR = f"{APPROVALS_DIR}/pending"
 COMPLETED_DIR = f"{APPROVALS_DIR}/completed"
 
+MIRROR_SUFFIX = ".json"
+LEGACY_MIRROR_SUFFIX = ".yaml"  # pre-JSON mirrors, migrated on first read
+DELTA_SUFFIX = ".log"  # append-only JSON-lines of field updates next to each mirror
+DELTA_COMPACT_BYTES = 8192  # fold the delta log back into the mirror past this size
+
+# Parsed mirror records keyed by path, validated by the mirror and delta-log
+# (st_mtime_ns, st_size) stamps. Insertion order doubles as LRU order; the
+# oldest entry is evicted past the cap.
+_PARSE_CACHE: dict[Path, tuple[tuple[int, ...], dict[str, Any]]] = {}
+_PARSE_CACHE_MAX = 2048
+
+# Project roots whose approval directories are known to exist
+_DIRS_READY: set[Path] = set()
+
+# request_id -> directory (PENDING_DIR/COMPLETED_DIR) holding its mirror.
+# The first lookup probes both directories directly; a second lookup for an
+# unknown ID builds the full index with one scan of both directories. Kept
+# current by save_yaml_mirror/move_yaml_to_completed so lookups need a single probe.
+_LOCATION_INDEX: dict[str, str] = {}
+_LOCATION_INDEX_READY = False
+_UNINDEXED_LOOKUPS = 0
+
 DEFAULT_API_BASE = "http://localhost:23000"
 GOVERNANCE_API_PATH = "/api/v1/governance/requests"
 API_TIMEOUT = 10
+API_READ_TIMEOUT = 3  # shorter timeout for the GET probe polled by wait
+SYNC_MAX_WORKERS = 16  # concurrent API round-trips during sync
+
+# wait polling: start fast, back off geometrically up to the max interval
+POLL_BACKOFF_MIN = 0.05
+POLL_BACKOFF_MAX = 5.0
+POLL_BACKOFF_FACTOR = 1.5
+
+# Errors raised when a kept-alive socket was closed by the server between calls
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+# Only these are replayed after such an error: a POST or PATCH may already have
+# been applied by the server before it dropped the socket
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "DELETE"})
 
 # Extended status values matching GovernanceRequest state machine
 VALID_STATUSES = frozenset(
@@ -60,6 +107,16 @@ VALID_STATUSES = frozenset(
     }
 )
 
+# Fields where API state overwrites the local mirror when both exist
+API_AUTHORITATIVE_FIELDS = (
+    "status",
+    "decision",
+    "decided_by",
+    "decided_at",
+    "decision_comment",
+    "updated_at",
+)
+
 # Terminal statuses — no further transitions possible
 TERMINAL_STATUSES = frozenset({"executed", "rejected"})
 
@@ -68,6 +125,12 @@ APPROVED_STATUSES = frozenset(
     {"local-approved", "remote-approved", "dual-approved", "executed"}
 )
 
+# CLI choice lists, shared by the cached argument parser
+SCOPE_CHOICES = ("local", "cross-team")
+RISK_CHOICES = ("low", "medium", "high", "critical")
+DECISION_CHOICES = ("approved", "rejected")
+LIST_STATUS_CHOICES = ("pending", "all")
+
 
 # ---------------------------------------------------------------------------
 # Governance REST API Client
@@ -75,12 +138,69 @@ APPROVED_STATUSES = frozenset(
 
 
 class GovernanceAPI:
-    """HTTP client for the AI Maestro GovernanceRequest REST API (stdlib-only)."""
+    """HTTP client for the AI Maestro GovernanceRequest REST API (stdlib-only).
+
+    Each thread keeps one persistent HTTP/1.1 connection to the API host, so
+    consecutive calls (sync, wait polling) reuse the socket instead of paying
+    a TCP/TLS handshake per request.
+    """
 
     def __init__(self, api_base: Optional[str] = None):
         base = api_base or os.environ.get("AIMAESTRO_API", DEFAULT_API_BASE)
         self.base_url = base.rstrip("/") + GOVERNANCE_API_PATH
         self.available = True  # set to False on connection failure
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._https = parts.scheme == "https"
+        self._netloc = parts.netloc
+        self._base_path = parts.path
+        self._local = threading.local()
+
+    def _connection(self, fresh: bool = False) -> http.client.HTTPConnection:
+        """Return this thread's kept-alive connection, opening a new one if needed."""
+        conn: Optional[http.client.HTTPConnection] = getattr(self._local, "conn", None)
+        if conn is not None and not fresh:
+            return conn
+        if conn is not None:
+            conn.close()
+        conn_cls = (
+            http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        )
+        conn = conn_cls(self._netloc, timeout=API_TIMEOUT)
+        self._local.conn = conn
+        return conn
+
+    def _send(
+        self, method: str, target: str, data: Optional[bytes], timeout: float
+    ) -> tuple[int, str, bytes]:
+        """Send one request on the kept-alive connection. Returns (status, reason, body)."""
+        headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        conn = self._connection()
+        conn.timeout = timeout
+        reused = conn.sock is not None
+        if reused:
+            conn.sock.settimeout(timeout)
+        try:
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                resp = conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                if not reused or method not in _IDEMPOTENT_METHODS:
+                    # Let _request fall back to the local mirror
+                    raise
+                # Server dropped the idle socket — retry once on a fresh connection
+                conn = self._connection(fresh=True)
+                conn.timeout = timeout
+                conn.request(method, target, body=data, headers=headers)
+                resp = conn.getresponse()
+            return resp.status, resp.reason, resp.read()
+        except (OSError, http.client.HTTPException):
+            # A timeout or failure can leave the connection mid-request (and
+            # unusable); close it so the next call on this thread reconnects
+            conn.close()
+            raise
 
     def _request(
         self,
@@ -88,51 +208,44 @@ class GovernanceAPI:
         path: str = "",
         body: Optional[dict[str, Any]] = None,
         query: Optional[dict[str, str]] = None,
+        timeout: float = API_TIMEOUT,
     ) -> Optional[dict[str, Any]]:
         """Send an HTTP request to the governance API. Returns parsed JSON or None on failure."""
         url = self.base_url + path
+        target = self._base_path + path
         if query:
-            # Build query string from dict
-            params = "&".join(
-                f"{k}={urllib.parse.quote(v)}" for k, v in query.items() if v
+            # Build query string from dict, dropping empty values
+            params = urllib.parse.urlencode(
+                {k: v for k, v in query.items() if v}, doseq=True
             )
             if params:
                 url += "?" + params
+                target += "?" + params
 
-        data = json.dumps(body).encode("utf-8") if body else None
-        req = urllib.request.Request(
-            url,
-            data=data,
-            method=method,
-            headers={
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-            },
-        )
+        data = _json_dumps_compact(body) if body else None
 
         try:
-            with urllib.request.urlopen(req, timeout=API_TIMEOUT) as resp:
-                raw = resp.read().decode("utf-8")
-                if not raw.strip():
-                    return {}  # 204 No Content
-                return json.loads(raw)
-        except urllib.error.HTTPError as exc:
-            # API returned an error status — still reachable
-            self.available = True
-            try:
-                error_body = json.loads(exc.read().decode("utf-8"))
-            except (json.JSONDecodeError, AttributeError):
-                error_body = {"error": exc.reason, "status": exc.code}
-            print(
-                f"WARNING: API error {exc.code} on {method} {url}: {error_body}",
-                file=sys.stderr,
-            )
-            return None
-        except (urllib.error.URLError, OSError, json.JSONDecodeError) as exc:
-            # API unreachable — degrade to YAML-only
+            status, reason, raw_bytes = self._send(method, target, data, timeout)
+            if status >= 400:
+                # API returned an error status — still reachable
+                self.available = True
+                try:
+                    error_body = _json_loads(raw_bytes)
+                except ValueError:
+                    error_body = {"error": reason, "status": status}
+                print(
+                    f"WARNING: API error {status} on {method} {url}: {error_body}",
+                    file=sys.stderr,
+                )
+                return None
+            if not raw_bytes.strip():
+                return {}  # 204 No Content
+            return _json_loads(raw_bytes)
+        except (http.client.HTTPException, OSError, ValueError) as exc:
+            # API unreachable — degrade to local mirror only
             self.available = False
             print(
-                f"WARNING: API unreachable ({exc}). Falling back to local YAML.",
+                f"WARNING: API unreachable ({exc}). Falling back to local mirror.",
                 file=sys.stderr,
             )
             return None
@@ -143,7 +256,7 @@ class GovernanceAPI:
 
     def get(self, request_id: str) -> Optional[dict[str, Any]]:
         """GET a GovernanceRequest by ID."""
-        return self._request("GET", path=f"/{request_id}")
+        return self._request("GET", path=f"/{request_id}", timeout=API_READ_TIMEOUT)
 
     def update(
         self, request_id: str, updates: dict[str, Any]
@@ -175,72 +288,74 @@ class GovernanceAPI:
 
 
 # ---------------------------------------------------------------------------
-# Simple YAML serializer/parser (stdlib-only)
+# JSON (de)serialization — orjson when installed, stdlib json otherwise
 # ---------------------------------------------------------------------------
 
 
-def dict_to_yaml(data: dict[str, Any], indent: int = 0) -> str:
-    """Convert a dictionary to YAML format string (stdlib-only, basic types)."""
-    lines = []
-    prefix = "  " * indent
-
-    for key, value in data.items():
-        if key.startswith("_"):
-            continue  # skip internal keys like _location
-        if value is None:
-            lines.append(f"{prefix}{key}: null")
-        elif isinstance(value, bool):
-            lines.append(f"{prefix}{key}: {str(value).lower()}")
-        elif isinstance(value, (int, float)):
-            lines.append(f"{prefix}{key}: {value}")
-        elif isinstance(value, str):
-            if "\n" in value:
-                lines.append(f"{prefix}{key}: |")
-                for line in value.split("\n"):
-                    lines.append(f"{prefix}  {line}")
-            elif any(c in value for c in [":", "#", "'", '"', "[", "]", "{", "}"]):
-                escaped = value.replace('"', '\\"')
-                lines.append(f'{prefix}{key}: "{escaped}"')
-            else:
-                lines.append(f"{prefix}{key}: {value}")
-        elif isinstance(value, list):
-            if not value:
-                lines.append(f"{prefix}{key}: []")
-            else:
-                lines.append(f"{prefix}{key}:")
-                for item in value:
-                    if isinstance(item, dict):
-                        lines.append(f"{prefix}  -")
-                        nested = dict_to_yaml(item, indent + 2)
-                        lines.append(nested)
-                    else:
-                        lines.append(f"{prefix}  - {item}")
-        elif isinstance(value, dict):
-            if not value:
-                lines.append(f"{prefix}{key}: {{}}")
-            else:
-                lines.append(f"{prefix}{key}:")
-                nested = dict_to_yaml(value, indent + 1)
-                lines.append(nested)
-        else:
-            lines.append(f"{prefix}{key}: {value}")
+def _json_dumps(data: dict[str, Any]) -> bytes:
+    """Serialize a mirror record to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def _json_dumps_compact(data: dict[str, Any]) -> bytes:
+    """Serialize ``data`` to compact UTF-8 JSON bytes for the API wire format."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _dumps(data: Any) -> str:
+    """Serialize CLI output and delta lines to compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(data, default=str).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"), default=str)
+
 
-    return "\n".join(lines)
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# ---------------------------------------------------------------------------
+# Legacy YAML parser (read-only, used to migrate pre-JSON mirrors)
+# ---------------------------------------------------------------------------
+
+
+def yaml_to_dict(yaml_str: str) -> dict[str, Any]:
+    """Parse a YAML string to dictionary (PyYAML when installed, stdlib fallback).
+
+    PyYAML is imported here rather than at module level: only legacy mirror
+    migration needs it, so normal CLI runs skip its import cost.
+    """
+    try:
+        import yaml
+    except ImportError:  # PyYAML is optional — fall back to the stdlib parser
+        return _yaml_to_dict_stdlib(yaml_str)
+    # libyaml-backed C loader when available, pure-Python PyYAML otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(yaml_str, Loader=loader)
+    return data if isinstance(data, dict) else {}
+
+
+# Unquoted scalars with a fixed meaning, matched after a single lower()
+_YAML_LITERALS: dict[str, Any] = {"null": None, "~": None, "true": True, "false": False}
 
 
 def parse_yaml_value(value: str) -> Any:
     """Parse a YAML value string to appropriate Python type."""
-    if (value.startswith('"') and value.endswith('"')) or (
-        value.startswith("'") and value.endswith("'")
-    ):
-        return value[1:-1]
+    quote = value[:1]
+    if quote in ('"', "'") and len(value) >= 2 and value[-1] == quote:
+        inner = value[1:-1]
+        # The old stdlib writer escaped embedded double quotes as \"
+        return inner.replace('\\"', '"') if quote == '"' else inner
 
-    if value.lower() == "null" or value == "~":
-        return None
-    if value.lower() == "true":
-        return True
-    if value.lower() == "false":
-        return False
+    lowered = value.lower()
+    if lowered in _YAML_LITERALS:
+        return _YAML_LITERALS[lowered]
 
     try:
         return int(value)
@@ -254,7 +369,7 @@ def parse_yaml_value(value: str) -> Any:
     return value
 
 
-def yaml_to_dict(yaml_str: str) -> dict[str, Any]:
+def _yaml_to_dict_stdlib(yaml_str: str) -> dict[str, Any]:
     """Parse a simple YAML string to dictionary (stdlib-only, basic types)."""
     result: dict[str, Any] = {}
     current_indent = 0
@@ -330,84 +445,269 @@ def yaml_to_dict(yaml_str: str) -> dict[str, Any]:
 
 
 # ---------------------------------------------------------------------------
-# Local YAML file operations
+# Local mirror file operations
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def get_project_root() -> Path:
     """Get the project root directory from environment or current directory."""
     project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
     return Path(project_dir)
 
 
+@functools.cache
+def _approval_dir(directory: str) -> Path:
+    """Absolute path of PENDING_DIR or COMPLETED_DIR under the project root."""
+    return get_project_root() / directory
+
+
 def ensure_directories() -> None:
-    """Ensure approval directories exist."""
+    """Ensure approval directories exist (checked once per project root)."""
     root = get_project_root()
-    (root / PENDING_DIR).mkdir(parents=True, exist_ok=True)
-    (root / COMPLETED_DIR).mkdir(parents=True, exist_ok=True)
+    if root in _DIRS_READY:
+        return
+    _approval_dir(PENDING_DIR).mkdir(parents=True, exist_ok=True)
+    _approval_dir(COMPLETED_DIR).mkdir(parents=True, exist_ok=True)
+    _DIRS_READY.add(root)
 
 
-def generate_request_id() -> str:
+def generate_request_id(now: Optional[float] = None) -> str:
     """Generate a GovernanceRequest ID in the GR-<timestamp>-<random> format."""
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    ts = time.strftime("%Y%m%d%H%M%S", time.gmtime(now))
     short_uuid = uuid.uuid4().hex[:8]
     return f"GR-{ts}-{short_uuid}"
 
 
-def get_timestamp() -> str:
-    """Get current timestamp in ISO format."""
-    return datetime.now(timezone.utc).isoformat()
+def get_timestamp(now: Optional[float] = None) -> str:
+    """Get current (or the given epoch ``now``) timestamp in ISO format."""
+    if now is None:
+        return datetime.now(timezone.utc).isoformat()
+    return datetime.fromtimestamp(now, timezone.utc).isoformat()
+
+
+def _write_mirror(filepath: Path, data: dict[str, Any]) -> None:
+    """Write a mirror record as JSON, skipping internal keys like _location.
+
+    Writes to a temp file and renames it into place, so a crash mid-write
+    never leaves a truncated mirror behind.
+    """
+    public = {k: v for k, v in data.items() if not k.startswith("_")}
+    tmp_path = filepath.with_suffix(".tmp")
+    tmp_path.write_bytes(_json_dumps(public))
+    os.replace(tmp_path, filepath)
+
+
+def _read_mirror(filepath: Path) -> dict[str, Any]:
+    """Read a JSON mirror record and fold in its delta log, if any."""
+    data = _json_loads(filepath.read_bytes())
+    if not isinstance(data, dict):
+        data = {}
+    try:
+        deltas = filepath.with_suffix(DELTA_SUFFIX).read_bytes()
+    except FileNotFoundError:
+        return data
+    for line in deltas.splitlines():
+        try:
+            data.update(_json_loads(line))
+        except ValueError:
+            break  # torn trailing line from an interrupted append
+    return data
+
+
+def _mirror_stamp(filepath: Path) -> tuple[int, ...]:
+    """Return the (mtime_ns, size) stamp of a mirror plus that of its delta log."""
+    st = filepath.stat()
+    try:
+        dst = filepath.with_suffix(DELTA_SUFFIX).stat()
+    except FileNotFoundError:
+        return (st.st_mtime_ns, st.st_size)
+    return (st.st_mtime_ns, st.st_size, dst.st_mtime_ns, dst.st_size)
+
+
+def _read_mirror_cached(
+    filepath: Path, stamp: Optional[tuple[int, ...]] = None
+) -> dict[str, Any]:
+    """Read a JSON mirror record, reusing the parsed copy if the file is unchanged.
+
+    ``stamp`` may be supplied by callers that already hold the stat results
+    (see _mirror_stamp); otherwise the files are stat()ed here.
+    """
+    if stamp is None:
+        stamp = _mirror_stamp(filepath)
+    cached = _PARSE_CACHE.pop(filepath, None)
+    if cached is not None and cached[0] == stamp:
+        data = cached[1]
+    else:
+        data = _read_mirror(filepath)
+    _PARSE_CACHE[filepath] = (stamp, data)
+    if len(_PARSE_CACHE) > _PARSE_CACHE_MAX:
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+    return dict(data)  # callers mutate top-level keys; keep the cached copy pristine
+
+
+def _migrate_legacy_mirror(legacy_path: Path) -> dict[str, Any]:
+    """Rewrite a legacy YAML mirror as JSON in the same directory and return its data."""
+    data = yaml_to_dict(legacy_path.read_text(encoding="utf-8"))
+    _write_mirror(legacy_path.with_suffix(MIRROR_SUFFIX), data)
+    legacy_path.unlink()
+    return data
 
 
 def save_yaml_mirror(
     request_id: str, data: dict[str, Any], pending: bool = True
 ) -> Path:
-    """Save an approval request to local YAML file (audit trail)."""
+    """Save an approval request to its local JSON mirror file (audit trail).
+
+    Writes the full record and drops any delta log, compacting the two.
+    """
     ensure_directories()
-    root = get_project_root()
     directory = PENDING_DIR if pending else COMPLETED_DIR
-    filepath = root / directory / f"{request_id}.yaml"
-    yaml_content = dict_to_yaml(data)
-    filepath.write_text(yaml_content, encoding="utf-8")
+    filepath = _approval_dir(directory) / f"{request_id}{MIRROR_SUFFIX}"
+    _PARSE_CACHE.pop(filepath, None)
+    _write_mirror(filepath, data)
+    filepath.with_suffix(DELTA_SUFFIX).unlink(missing_ok=True)
+    _LOCATION_INDEX[request_id] = directory
+    return filepath
+
+
+def append_mirror_delta(
+    request_id: str, changes: dict[str, Any], pending: bool = True
+) -> Path:
+    """Record a field update by appending it to the mirror's delta log.
+
+    Avoids rewriting the whole record for small status changes. The mirror
+    file must already exist; the log is compacted into it once it grows past
+    DELTA_COMPACT_BYTES.
+    """
+    directory = PENDING_DIR if pending else COMPLETED_DIR
+    filepath = _approval_dir(directory) / f"{request_id}{MIRROR_SUFFIX}"
+    delta_path = filepath.with_suffix(DELTA_SUFFIX)
+    line = _dumps(changes) + "\n"
+    _PARSE_CACHE.pop(filepath, None)
+    with open(delta_path, "ab") as f:
+        f.write(line.encode("utf-8"))
+        size = f.tell()
+    if size > DELTA_COMPACT_BYTES:
+        save_yaml_mirror(request_id, _read_mirror(filepath), pending=pending)
     return filepath
 
 
+def _build_location_index() -> None:
+    """Index which approval directory holds each mirror (one scandir per directory)."""
+    global _LOCATION_INDEX_READY
+    # Completed first so pending wins for IDs present in both, matching lookup order
+    for directory in (COMPLETED_DIR, PENDING_DIR):
+        try:
+            with os.scandir(_approval_dir(directory)) as it:
+                for entry in it:
+                    stem, dot, suffix = entry.name.rpartition(".")
+                    if dot and f".{suffix}" in (MIRROR_SUFFIX, LEGACY_MIRROR_SUFFIX):
+                        _LOCATION_INDEX[stem] = directory
+        except FileNotFoundError:
+            continue
+    _LOCATION_INDEX_READY = True
+
+
+def _load_mirror_from(directory: str, request_id: str) -> Optional[dict[str, Any]]:
+    """Load a mirror from one approval directory, migrating legacy YAML if found."""
+    filepath = _approval_dir(directory) / f"{request_id}{MIRROR_SUFFIX}"
+    try:
+        data = _read_mirror(filepath)
+    except FileNotFoundError:
+        legacy_path = filepath.with_suffix(LEGACY_MIRROR_SUFFIX)
+        if not legacy_path.exists():
+            return None
+        data = _migrate_legacy_mirror(legacy_path)
+    data["_location"] = "pending" if directory == PENDING_DIR else "completed"
+    return data
+
+
 def load_yaml_mirror(request_id: str) -> Optional[dict[str, Any]]:
-    """Load an approval request from local YAML file."""
-    root = get_project_root()
+    """Load an approval request from its local mirror, migrating legacy YAML if found."""
+    global _UNINDEXED_LOOKUPS
+    indexed = _LOCATION_INDEX.get(request_id)
+    if indexed is None and not _LOCATION_INDEX_READY:
+        # A one-off lookup is cheaper as direct probes than a full scan
+        _UNINDEXED_LOOKUPS += 1
+        if _UNINDEXED_LOOKUPS > 1:
+            _build_location_index()
+            indexed = _LOCATION_INDEX.get(request_id)
+    if indexed is not None:
+        data = _load_mirror_from(indexed, request_id)
+        if data is not None:
+            return data
+
+    # Not indexed (or moved by another process) — probe both directories
     for directory in [PENDING_DIR, COMPLETED_DIR]:
-        filepath = root / directory / f"{request_id}.yaml"
-        if filepath.exists():
-            yaml_content = filepath.read_text(encoding="utf-8")
-            data = yaml_to_dict(yaml_content)
-            data["_location"] = "pending" if directory == PENDING_DIR else "completed"
+        if directory == indexed:
+            continue
+        data = _load_mirror_from(directory, request_id)
+        if data is not None:
+            _LOCATION_INDEX[request_id] = directory
             return data
+    _LOCATION_INDEX.pop(request_id, None)
     return None
 
 
 def move_yaml_to_completed(request_id: str) -> None:
-    """Move a YAML file from pending to completed directory."""
-    root = get_project_root()
-    pending_path = root / PENDING_DIR / f"{request_id}.yaml"
+    """Move a mirror file (and its delta log) from pending to completed directory.
+
+    If the completed copy was already written, the stale pending copy is
+    removed instead of being renamed over it.
+    """
+    pending_path = _approval_dir(PENDING_DIR) / f"{request_id}{MIRROR_SUFFIX}"
     if pending_path.exists():
         ensure_directories()
-        completed_path = root / COMPLETED_DIR / f"{request_id}.yaml"
+        completed_path = _approval_dir(COMPLETED_DIR) / f"{request_id}{MIRROR_SUFFIX}"
+        _PARSE_CACHE.pop(pending_path, None)
+        _PARSE_CACHE.pop(completed_path, None)
+        pending_delta = pending_path.with_suffix(DELTA_SUFFIX)
+        _LOCATION_INDEX[request_id] = COMPLETED_DIR
+        if completed_path.exists():
+            pending_path.unlink()
+            pending_delta.unlink(missing_ok=True)
+            return
         pending_path.rename(completed_path)
+        if pending_delta.exists():
+            pending_delta.rename(completed_path.with_suffix(DELTA_SUFFIX))
 
 
 def list_local_yaml(directory: str) -> list[dict[str, Any]]:
-    """List all YAML files in a directory and parse them."""
+    """List all mirror files in a directory and parse them."""
     ensure_directories()
-    root = get_project_root()
-    target_dir = root / directory
+    target_dir = _approval_dir(directory)
+    # One scandir pass: DirEntry carries the name and cached stat, and tells us
+    # which mirrors have a delta log without probing for it per file
+    with os.scandir(target_dir) as it:
+        entries = {entry.name: entry for entry in it}
+
     results = []
-    for filepath in target_dir.glob("*.yaml"):
+    for name in [n for n in entries if n.endswith(LEGACY_MIRROR_SUFFIX)]:
+        legacy_path = Path(entries[name].path)
+        if legacy_path.stem + MIRROR_SUFFIX in entries:
+            # A JSON mirror supersedes the legacy file (as in _load_mirror_from);
+            # migrating would overwrite it with stale data
+            continue
         try:
-            yaml_content = filepath.read_text(encoding="utf-8")
-            data = yaml_to_dict(yaml_content)
-            results.append(data)
+            results.append(_migrate_legacy_mirror(legacy_path))
         except Exception as e:
-            results.append({"request_id": filepath.stem, "error": str(e)})
+            results.append({"request_id": legacy_path.stem, "error": str(e)})
+
+    for name, entry in entries.items():
+        if not name.endswith(MIRROR_SUFFIX):
+            continue
+        stem = name[: -len(MIRROR_SUFFIX)]
+        try:
+            st = entry.stat(follow_symlinks=False)
+            stamp: tuple[int, ...] = (st.st_mtime_ns, st.st_size)
+            delta = entries.get(stem + DELTA_SUFFIX)
+            if delta is not None:
+                dst = delta.stat(follow_symlinks=False)
+                stamp += (dst.st_mtime_ns, dst.st_size)
+            results.append(_read_mirror_cached(Path(entry.path), stamp))
+        except Exception as e:
+            results.append({"request_id": stem, "error": str(e)})
     return results
 
 
@@ -422,7 +722,11 @@ def send_amp_message(
     content: dict[str, Any],
     priority: str = "normal",
 ) -> bool:
-    """Send a message via AMP CLI (amp-send)."""
+    """Send a message via AMP CLI (amp-send).
+
+    Returns True once amp-send has been launched; delivery is not awaited
+    unless AMCOS_SYNC_AMP=1 is set.
+    """
     msg_type = (
         content.get("type", "request") if isinstance(content, dict) else "request"
     )
@@ -432,40 +736,59 @@ def send_amp_message(
         else str(content)
     )
 
+    cmd = [
+        "amp-send",
+        to,
+        subject,
+        message,
+        "--priority",
+        priority,
+        "--type",
+        str(msg_type),
+    ]
+
+    # AMCOS_SYNC_AMP=1 waits for delivery (used by tests needing the real status)
+    if os.environ.get("AMCOS_SYNC_AMP") == "1":
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            return result.returncode == 0
+        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+            return False
+
+    # Fire-and-forget: the CLI should not block on message delivery
     try:
-        result = subprocess.run(
-            [
-                "amp-send",
-                to,
-                subject,
-                message,
-                "--priority",
-                priority,
-                "--type",
-                str(msg_type),
-            ],
-            capture_output=True,
-            text=True,
-            timeout=30,
+        subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
         )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return True
+    except (FileNotFoundError, OSError):
         return False
 
 
 # ---------------------------------------------------------------------------
-# Merge logic: API state wins over local YAML
+# Merge logic: API state wins over local mirror
 # ---------------------------------------------------------------------------
 
 
 def merge_api_and_yaml(
-    api_data: Optional[dict[str, Any]], yaml_data: Optional[dict[str, Any]]
+    api_data: Optional[dict[str, Any]],
+    yaml_data: Optional[dict[str, Any]],
+    *,
+    inplace: bool = False,
 ) -> dict[str, Any]:
-    """Merge API and YAML data. API state takes priority for status/decision fields."""
+    """Merge API and local mirror data. API state takes priority for status/decision fields.
+
+    With ``inplace=True`` and both inputs present, ``yaml_data`` itself is
+    updated and returned instead of a copy.
+    """
     if api_data is None and yaml_data is None:
         return {}
     if api_data is None:
-        # API unavailable — use YAML but flag it
+        # API unavailable — use local mirror but flag it
         result = dict(yaml_data or {})
         result["_source"] = "local-only"
         return result
@@ -475,26 +798,19 @@ def merge_api_and_yaml(
         result["_source"] = "api-only"
         return result
 
-    # Both exist — API wins for authoritative fields, YAML fills in extras
-    result = dict(yaml_data)
-    # API overwrites these authoritative fields
-    for key in (
-        "status",
-        "decision",
-        "decided_by",
-        "decided_at",
-        "decision_comment",
-        "updated_at",
-    ):
-        if key in api_data and api_data[key] is not None:
-            result[key] = api_data[key]
+    # Both exist — API wins for authoritative fields, local mirror fills in extras
+    result = yaml_data if inplace else dict(yaml_data)
+    for key in API_AUTHORITATIVE_FIELDS:
+        value = api_data.get(key)
+        if value is not None:
+            result[key] = value
     result["api_synced"] = True
     result["_source"] = "merged"
     return result
 
 
 # ---------------------------------------------------------------------------
-# Core operations (API-first with YAML fallback)
+# Core operations (API-first with local mirror fallback)
 # ---------------------------------------------------------------------------
 
 
@@ -511,9 +827,11 @@ def create_request(
     target_cos: Optional[str] = None,
     target_manager: Optional[str] = None,
 ) -> dict[str, Any]:
-    """Create a new GovernanceRequest. Posts to API first, mirrors to local YAML."""
-    request_id = generate_request_id()
-    timestamp = get_timestamp()
+    """Create a new GovernanceRequest. Posts to API first, mirrors to local JSON."""
+    # One clock read serves both the ID and the created/updated timestamps
+    now = time.time()
+    request_id = generate_request_id(now)
+    timestamp = get_timestamp(now)
 
     # Session name for COS identification
     session_name = os.environ.get(
@@ -563,7 +881,7 @@ def create_request(
             request_data["request_id"] = api_response["request_id"]
             request_id = api_response["request_id"]
 
-    # Step 2: Save local YAML mirror (audit trail)
+    # Step 2: Save local mirror (audit trail)
     filepath = save_yaml_mirror(request_id, request_data, pending=True)
 
     # Step 3: Send AMP notification to manager for approval routing
@@ -598,16 +916,37 @@ def create_request(
     }
 
 
-def get_request(api: GovernanceAPI, request_id: str) -> dict[str, Any]:
-    """Get a GovernanceRequest. Queries API first, merges with local YAML."""
+def get_request(
+    api: GovernanceAPI,
+    request_id: str,
+    yaml_data: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """Get a GovernanceRequest. Queries API first, merges with local mirror.
+
+    Pass ``yaml_data`` (a record from load_yaml_mirror) to skip re-reading the
+    mirror while the API answers; it is updated in place with any changes.
+    When the API is unreachable the mirror is always re-read from disk.
+    """
     # Step 1: Try API (primary authority)
     api_data = api.get(request_id)
 
-    # Step 2: Load local YAML (audit trail)
-    yaml_data = load_yaml_mirror(request_id)
+    # Step 2: Load local mirror (audit trail)
+    if yaml_data is None or api_data is None:
+        yaml_data = load_yaml_mirror(request_id)
 
-    # Step 3: Merge (API wins)
-    merged = merge_api_and_yaml(api_data, yaml_data)
+    # Fields the API state will change in the local mirror
+    changes: dict[str, Any] = {}
+    if api_data is not None and yaml_data is not None:
+        changes = {
+            k: api_data[k]
+            for k in API_AUTHORITATIVE_FIELDS
+            if api_data.get(k) is not None and yaml_data.get(k) != api_data[k]
+        }
+        if yaml_data.get("api_synced") is not True:
+            changes["api_synced"] = True
+
+    # Step 3: Merge (API wins) — yaml_data is ours to update, so merge in place
+    merged = merge_api_and_yaml(api_data, yaml_data, inplace=True)
 
     if not merged:
         return {
@@ -616,13 +955,16 @@ def get_request(api: GovernanceAPI, request_id: str) -> dict[str, Any]:
             "status": "not_found",
         }
 
-    # Update local YAML to reflect API state if needed
+    # Update local mirror to reflect API state if needed — only changed fields
     if api_data is not None and yaml_data is not None:
-        yaml_data.update({k: v for k, v in merged.items() if not k.startswith("_")})
-        is_terminal = merged.get("status") in TERMINAL_STATUSES
-        save_yaml_mirror(request_id, yaml_data, pending=not is_terminal)
-        if is_terminal:
+        in_pending = yaml_data.get("_location") != "completed"
+        if merged.get("status") in TERMINAL_STATUSES and in_pending:
+            # Terminal transition: compact the full record into completed/
+            save_yaml_mirror(request_id, yaml_data, pending=False)
             move_yaml_to_completed(request_id)
+            yaml_data["_location"] = "completed"
+        elif changes:
+            append_mirror_delta(request_id, changes, pending=in_pending)
 
     return {
         "success": True,
@@ -644,7 +986,7 @@ def get_request(api: GovernanceAPI, request_id: str) -> dict[str, Any]:
 
 
 def list_requests(api: GovernanceAPI, status_filter: str = "pending") -> dict[str, Any]:
-    """List GovernanceRequests. Queries API first, merges with local YAML."""
+    """List GovernanceRequests. Queries API first, merges with local mirror."""
     api_requests: list[dict[str, Any]] = []
     local_requests: list[dict[str, Any]] = []
 
@@ -659,53 +1001,48 @@ def list_requests(api: GovernanceAPI, status_filter: str = "pending") -> dict[st
     if api_result is not None:
         api_requests = api_result
 
-    # Step 2: Load local YAML
+    # Step 2: Load local mirror
     if status_filter in ("pending", "all"):
         local_requests.extend(list_local_yaml(PENDING_DIR))
     if status_filter in ("all",):
         local_requests.extend(list_local_yaml(COMPLETED_DIR))
 
-    # Step 3: Merge — API is authoritative, add any local-only requests
-    api_ids = {r.get("request_id") for r in api_requests}
-    merged: list[dict[str, Any]] = []
-
-    for api_req in api_requests:
-        merged.append(
-            {
-                "request_id": api_req.get("request_id"),
-                "operation_type": api_req.get("operation_type", api_req.get("type")),
-                "agent_name": api_req.get("agent_name", ""),
-                "status": api_req.get("status"),
-                "requester": api_req.get("requester"),
-                "created_at": api_req.get("created_at"),
-                "decision": api_req.get("decision"),
-                "decided_at": api_req.get("decided_at"),
-                "api_synced": True,
-                "_source": "api",
-            }
-        )
-
-    # Add local-only requests (not in API)
+    # Step 3: Merge — keyed by request_id so API records overwrite local ones
+    by_id: dict[Any, dict[str, Any]] = {}
     for local_req in local_requests:
         req_id = local_req.get("request_id")
-        if req_id and req_id not in api_ids:
-            merged.append(
-                {
-                    "request_id": req_id,
-                    "operation_type": local_req.get("operation_type"),
-                    "agent_name": local_req.get("agent_name"),
-                    "status": local_req.get("status"),
-                    "requester": local_req.get("requester"),
-                    "created_at": local_req.get("created_at"),
-                    "decision": local_req.get("decision"),
-                    "decided_at": local_req.get("decided_at"),
-                    "api_synced": local_req.get("api_synced", False),
-                    "_source": "local-only",
-                }
-            )
+        if req_id:
+            by_id[req_id] = {
+                "request_id": req_id,
+                "operation_type": local_req.get("operation_type"),
+                "agent_name": local_req.get("agent_name"),
+                "status": local_req.get("status"),
+                "requester": local_req.get("requester"),
+                "created_at": local_req.get("created_at") or "",
+                "decision": local_req.get("decision"),
+                "decided_at": local_req.get("decided_at"),
+                "api_synced": local_req.get("api_synced", False),
+                "_source": "local-only",
+            }
 
-    # Sort by created_at (newest first)
-    merged.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+    for api_req in api_requests:
+        by_id[api_req.get("request_id")] = {
+            "request_id": api_req.get("request_id"),
+            "operation_type": api_req.get("operation_type", api_req.get("type")),
+            "agent_name": api_req.get("agent_name", ""),
+            "status": api_req.get("status"),
+            "requester": api_req.get("requester"),
+            "created_at": api_req.get("created_at") or "",
+            "decision": api_req.get("decision"),
+            "decided_at": api_req.get("decided_at"),
+            "api_synced": True,
+            "_source": "api",
+        }
+
+    # Sort by created_at (newest first); created_at is always a str above
+    merged = sorted(
+        by_id.values(), key=operator.itemgetter("created_at"), reverse=True
+    )
 
     pending_count = sum(1 for r in merged if r.get("status") == "pending")
 
@@ -725,7 +1062,7 @@ def respond_to_request(
     comment: str,
     decided_by: str = "user",
 ) -> dict[str, Any]:
-    """Approve or reject a GovernanceRequest. Patches API first, mirrors to local YAML."""
+    """Approve or reject a GovernanceRequest. Patches API first, mirrors to local JSON."""
     # Map simple decisions to GovernanceRequest state machine values
     # "approved" → "local-approved" (single-manager approval)
     # "rejected" → "rejected"
@@ -755,15 +1092,18 @@ def respond_to_request(
     api_response = api.update(request_id, update_payload)
     api_synced = api_response is not None
 
-    # Step 2: Update local YAML mirror
+    # Step 2: Update local mirror
     yaml_data = load_yaml_mirror(request_id)
     if yaml_data:
-        yaml_data.update(update_payload)
-        yaml_data["api_synced"] = api_synced
-        is_terminal = api_status in TERMINAL_STATUSES
-        save_yaml_mirror(request_id, yaml_data, pending=not is_terminal)
-        if is_terminal:
+        changes = dict(update_payload, api_synced=api_synced)
+        in_pending = yaml_data.get("_location") != "completed"
+        yaml_data.update(changes)
+        if api_status in TERMINAL_STATUSES and in_pending:
+            # Terminal transition: compact the full record into completed/
+            save_yaml_mirror(request_id, yaml_data, pending=False)
             move_yaml_to_completed(request_id)
+        else:
+            append_mirror_delta(request_id, changes, pending=in_pending)
     elif not api_synced:
         return {
             "success": False,
@@ -771,9 +1111,10 @@ def respond_to_request(
         }
 
     # Step 3: Notify requester via AMP
-    requester = (yaml_data or {}).get("requester", "unknown")
-    operation_type = (yaml_data or {}).get("operation_type", "unknown")
-    agent_name = (yaml_data or {}).get("agent_name", "unknown")
+    req = yaml_data or {}
+    requester = req.get("requester", "unknown")
+    operation_type = req.get("operation_type", "unknown")
+    agent_name = req.get("agent_name", "unknown")
 
     notification_sent = send_amp_message(
         to=requester,
@@ -809,13 +1150,24 @@ def wait_for_decision(
     api: GovernanceAPI,
     request_id: str,
     timeout_seconds: int = 120,
+    poll_backoff_min: float = POLL_BACKOFF_MIN,
+    poll_backoff_max: float = POLL_BACKOFF_MAX,
 ) -> dict[str, Any]:
-    """Poll for a GovernanceRequest decision. Checks API first, then local YAML."""
+    """Poll for a GovernanceRequest decision. Checks API first, then local mirror.
+
+    The poll interval starts at ``poll_backoff_min`` seconds and grows by
+    POLL_BACKOFF_FACTOR per poll up to ``poll_backoff_max``, so fast decisions
+    are seen almost immediately while long waits stay cheap.
+    """
     start_time = time.time()
-    poll_interval = 5
+    poll_interval = poll_backoff_min
+
+    # Keep the local record in memory across polls; get_request only
+    # re-reads it from disk when the API cannot answer
+    local = load_yaml_mirror(request_id)
 
     # Verify request exists
-    initial = get_request(api, request_id)
+    initial = get_request(api, request_id, yaml_data=local)
     if not initial.get("success"):
         return initial
 
@@ -844,7 +1196,7 @@ def wait_for_decision(
             }
 
         # Poll API first (authoritative)
-        current = get_request(api, request_id)
+        current = get_request(api, request_id, yaml_data=local)
         if current.get("success"):
             cur_status = current.get("status", "")
             if cur_status in TERMINAL_STATUSES or cur_status in APPROVED_STATUSES:
@@ -858,56 +1210,72 @@ def wait_for_decision(
                     "waited_seconds": int(elapsed),
                 }
 
-        time.sleep(poll_interval)
+        time.sleep(min(poll_interval, max(timeout_seconds - elapsed, 0)))
+        poll_interval = min(poll_interval * POLL_BACKOFF_FACTOR, poll_backoff_max)
 
 
-def sync_local_to_api(api: GovernanceAPI) -> dict[str, Any]:
-    """Sync all local-only (unsynced) YAML requests to the API."""
-    if not api.available:
-        # Test connectivity first
-        api._request("GET", query={"limit": "1"})
-        if not api.available:
-            return {"success": False, "error": "API unreachable, cannot sync"}
+def _sync_one(api: GovernanceAPI, directory: str, data: dict[str, Any]) -> str:
+    """Sync one local mirror record to the API. Returns a status tag for tallying."""
+    req_id = data.get("request_id")
+    if not req_id:
+        return "skipped"
 
-    synced = 0
-    failed = 0
-    already_synced = 0
+    if data.get("api_synced"):
+        return "already_synced"
 
-    for directory in [PENDING_DIR, COMPLETED_DIR]:
+    # Check if it already exists in API; submit it if not
+    existing = api.get(req_id)
+    if existing is None and api.submit(data) is None:
+        return "failed"
+
+    # Now in API — mark synced locally
+    append_mirror_delta(req_id, {"api_synced": True}, pending=directory == PENDING_DIR)
+    return "synced"
+
+
+def sync_local_to_api(api: GovernanceAPI) -> dict[str, Any]:
+    """Sync all local-only (unsynced) mirrored requests to the API."""
+    # One listing round-trip doubles as the connectivity check and tells us
+    # which records the API already has; anything missing from it (or every
+    # record, if the listing fails) still gets the per-record check below
+    listed = api.list_requests()
+    if listed is None and not api.available:
+        return {"success": False, "error": "API unreachable, cannot sync"}
+    known_ids = {r.get("request_id") for r in listed or () if isinstance(r, dict)}
+
+    tags: list[str] = []
+    to_check: list[tuple[str, dict[str, Any]]] = []
+    for directory in (PENDING_DIR, COMPLETED_DIR):
         for data in list_local_yaml(directory):
             req_id = data.get("request_id")
             if not req_id:
-                continue
-
-            if data.get("api_synced"):
-                already_synced += 1
-                continue
+                tags.append("skipped")
+            elif data.get("api_synced"):
+                tags.append("already_synced")
+            elif req_id in known_ids:
+                # Already in the API — just mark synced locally
+                append_mirror_delta(
+                    req_id, {"api_synced": True}, pending=directory == PENDING_DIR
+                )
+                tags.append("synced")
+            else:
+                to_check.append((directory, data))
 
-            # Check if it already exists in API
-            existing = api.get(req_id)
-            if existing is not None:
-                # Already in API — just mark synced locally
-                data["api_synced"] = True
-                is_pending = directory == PENDING_DIR
-                save_yaml_mirror(req_id, data, pending=is_pending)
-                synced += 1
-                continue
+    if to_check:
+        # Imported here: only sync needs a pool, and it pulls in logging at import
+        import concurrent.futures
 
-            # Submit to API
-            result = api.submit(data)
-            if result is not None:
-                data["api_synced"] = True
-                is_pending = directory == PENDING_DIR
-                save_yaml_mirror(req_id, data, pending=is_pending)
-                synced += 1
-            else:
-                failed += 1
+        # Each record is an independent get/submit round-trip — run them concurrently
+        workers = min(SYNC_MAX_WORKERS, len(to_check))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            tags.extend(ex.map(lambda item: _sync_one(api, *item), to_check))
 
+    failed = tags.count("failed")
     return {
         "success": failed == 0,
-        "synced": synced,
+        "synced": tags.count("synced"),
         "failed": failed,
-        "already_synced": already_synced,
+        "already_synced": tags.count("already_synced"),
         "api_available": api.available,
     }
 
@@ -917,9 +1285,23 @@ def sync_local_to_api(api: GovernanceAPI) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-def main() -> None:
-    """Main CLI entry point."""
-    out = AmcosOutput("amcos_approval_manager")
+def _positive_seconds(value: str) -> float:
+    """argparse type for a finite, positive number of seconds."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = float("nan")
+    # Also rejects NaN and infinity; 0 would make wait busy-poll the API
+    if not 0 < seconds < float("inf"):
+        raise argparse.ArgumentTypeError(
+            f"must be a positive number of seconds, got {value!r}"
+        )
+    return seconds
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description="AMCOS Approval Manager - Dual-authority GovernanceRequest management",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -938,12 +1320,12 @@ Examples:
     parser.add_argument(
         "--api-only",
         action="store_true",
-        help="Skip local YAML entirely (pure API mode)",
+        help="Skip local mirror entirely (pure API mode)",
     )
     parser.add_argument(
         "--offline",
         action="store_true",
-        help="Skip API entirely (pure YAML mode, for testing)",
+        help="Skip API entirely (pure local-mirror mode, for testing)",
     )
     parser.add_argument(
         "--api-url",
@@ -971,13 +1353,13 @@ Examples:
     create_parser.add_argument(
         "--scope",
         default="local",
-        choices=["local", "cross-team"],
+        choices=SCOPE_CHOICES,
         help="Operation scope",
     )
     create_parser.add_argument(
         "--risk",
         default="low",
-        choices=["low", "medium", "high", "critical"],
+        choices=RISK_CHOICES,
         help="Risk level",
     )
     create_parser.add_argument(
@@ -1004,7 +1386,7 @@ Examples:
     list_parser.add_argument(
         "--status",
         default="pending",
-        choices=["pending", "all"],
+        choices=LIST_STATUS_CHOICES,
         help="Filter (default: pending)",
     )
 
@@ -1014,7 +1396,7 @@ Examples:
     )
     respond_parser.add_argument("--id", required=True, help="Request ID")
     respond_parser.add_argument(
-        "--decision", required=True, choices=["approved", "rejected"], help="Decision"
+        "--decision", required=True, choices=DECISION_CHOICES, help="Decision"
     )
     respond_parser.add_argument("--comment", required=True, help="Decision comment")
     respond_parser.add_argument(
@@ -1029,10 +1411,29 @@ Examples:
     wait_parser.add_argument(
         "--timeout", type=int, default=120, help="Timeout in seconds (default: 120)"
     )
+    wait_parser.add_argument(
+        "--poll-min",
+        type=_positive_seconds,
+        default=POLL_BACKOFF_MIN,
+        help=f"Initial poll interval in seconds (default: {POLL_BACKOFF_MIN})",
+    )
+    wait_parser.add_argument(
+        "--poll-max",
+        type=_positive_seconds,
+        default=POLL_BACKOFF_MAX,
+        help=f"Maximum poll interval in seconds (default: {POLL_BACKOFF_MAX})",
+    )
 
     # sync
     subparsers.add_parser("sync", help="Sync local-only requests to the API")
 
+    return parser
+
+
+def main() -> None:
+    """Main CLI entry point."""
+    out = AmcosOutput("amcos_approval_manager")
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.command is None:
@@ -1076,15 +1477,22 @@ Examples:
             decided_by=args.decided_by,
         )
     elif args.command == "wait":
+        if args.poll_max < args.poll_min:
+            out.close()
+            parser.error("--poll-max must not be smaller than --poll-min")
         result = wait_for_decision(
-            api, request_id=args.id, timeout_seconds=args.timeout
+            api,
+            request_id=args.id,
+            timeout_seconds=args.timeout,
+            poll_backoff_min=args.poll_min,
+            poll_backoff_max=args.poll_max,
         )
     elif args.command == "sync":
         result = sync_local_to_api(api)
 
     # Output JSON
     out.log_json(result, label=args.command)
-    print(json.dumps(result, separators=(",", ":"), default=str))
+    print(_dumps(result))
 
     # Exit with appropriate code
     if result.get("success", True):
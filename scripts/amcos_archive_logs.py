@@ -19,8 +19,9 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import errno
 import json
-import shutil
+import os
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -28,6 +29,11 @@ from typing import Any
 
 from amcos_output_utils import AmcosOutput
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -36,6 +42,15 @@ LOGS_DIR = ".ai-maestro/logs"
 ARCHIVE_SUBDIR = "archive"
 DEFAULT_DAYS = 30
 
+# (unit, divisor) per 1024x tier, indexed by (bit_length - 1) // 10
+_SIZE_UNITS = (
+    ("B", 1),
+    ("KB", 1024),
+    ("MB", 1024**2),
+    ("GB", 1024**3),
+    ("TB", 1024**4),
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -61,8 +76,8 @@ def file_mtime(path: Path) -> datetime:
     Returns:
         Modification time in UTC.
     """
-    stat = path.stat()
-    return datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+    st = path.stat()
+    return datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
 
 
 def file_size_bytes(path: Path) -> int:
@@ -77,6 +92,13 @@ def file_size_bytes(path: Path) -> int:
     return path.stat().st_size
 
 
+def _dumps(data: Any) -> str:
+    """Serialize data to compact JSON text (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, separators=(",", ":"))
+
+
 def format_size(size_bytes: int) -> str:
     """Format a byte count as a human-readable string.
 
@@ -86,14 +108,11 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., '1.5 MB', '320 KB').
     """
-    if size_bytes < 1024:
+    tier = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+    if tier == 0:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    unit, divisor = _SIZE_UNITS[tier]
+    return f"{size_bytes / divisor:.1f} {unit}"
 
 
 # ---------------------------------------------------------------------------
@@ -101,7 +120,9 @@ def format_size(size_bytes: int) -> str:
 # ---------------------------------------------------------------------------
 
 
-def find_old_logs(logs_dir: Path, cutoff: datetime) -> list[Path]:
+def find_old_logs(
+    logs_dir: Path, cutoff: datetime
+) -> list[tuple[Path, os.stat_result]]:
     """Find log files older than the cutoff date.
 
     Only considers files directly in the logs directory (not in archive/
@@ -112,63 +133,86 @@ def find_old_logs(logs_dir: Path, cutoff: datetime) -> list[Path]:
         cutoff: Files modified before this datetime will be returned.
 
     Returns:
-        List of paths to old log files, sorted by modification time.
+        List of (path, stat result) pairs for old log files, sorted by
+        modification time. The stat result is reused for size and mtime.
     """
-    old_files: list[Path] = []
+    old_files: list[tuple[Path, os.stat_result]] = []
+    # Compare raw st_mtime floats rather than building a datetime per file
+    cutoff_ts = cutoff.timestamp()
 
-    if not logs_dir.is_dir():
+    try:
+        it = os.scandir(logs_dir)
+    except OSError:
         return old_files
 
-    for entry in sorted(logs_dir.iterdir()):
-        # Skip directories (including archive/)
-        if not entry.is_file():
-            continue
-
-        mtime = file_mtime(entry)
-        if mtime < cutoff:
-            old_files.append(entry)
-
-    # Sort oldest first
-    old_files.sort(key=lambda p: file_mtime(p))
+    with it:
+        for entry in it:
+            if entry.name == ARCHIVE_SUBDIR:
+                continue  # the archive itself — skip without any type check
+            try:
+                # DirEntry caches the type and stat, so this is one syscall at most
+                if not entry.is_file():
+                    continue  # Skip directories (including archive/)
+                st = entry.stat()
+            except OSError:
+                continue
+
+            if st.st_mtime < cutoff_ts:
+                old_files.append((Path(entry.path), st))
+
+    # Sort oldest first, by name for equal mtimes
+    old_files.sort(key=lambda item: (item[1].st_mtime, item[0].name))
     return old_files
 
 
-def archive_file(file_path: Path, archive_root: Path, verbose: bool = False) -> Path:
+def archive_file(file_path: Path, month_dir: Path, verbose: bool = False) -> Path:
     """Move a log file to the archive directory, preserving timestamps.
 
-    The file is placed in archive/YYYY-MM/ based on its modification time.
+    The caller creates month_dir (archive/YYYY-MM/ for the file's modification
+    time) once per month before moving that month's files into it.
 
     Args:
         file_path: Path to the log file to archive.
-        archive_root: Root archive directory (.ai-maestro/logs/archive/).
+        month_dir: Existing month directory (.ai-maestro/logs/archive/YYYY-MM/).
         verbose: If True, print progress to stderr.
 
     Returns:
         Path to the archived file.
     """
-    mtime = file_mtime(file_path)
-    month_dir = archive_root / mtime.strftime("%Y-%m")
-    month_dir.mkdir(parents=True, exist_ok=True)
-
     dest = month_dir / file_path.name
 
-    # Handle name collisions by appending a counter
-    if dest.exists():
-        stem = file_path.stem
-        suffix = file_path.suffix
-        counter = 1
-        while dest.exists():
-            dest = month_dir / f"{stem}_{counter}{suffix}"
+    # Reserve the destination name atomically; on collision append a counter.
+    # The move below replaces the empty placeholder.
+    counter = 1
+    while True:
+        try:
+            os.close(os.open(dest, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+            break
+        except FileExistsError:
+            dest = month_dir / f"{file_path.stem}_{counter}{file_path.suffix}"
             counter += 1
 
     if verbose:
         print(
-            f"  {file_path.name} -> {dest.relative_to(archive_root.parent)}",
+            f"  {file_path.name} -> {dest.relative_to(month_dir.parent.parent)}",
             file=sys.stderr,
         )
 
-    # Move the file (shutil.move preserves metadata on same filesystem)
-    shutil.move(str(file_path), str(dest))
+    # archive/ normally lives on the same filesystem as the logs, so a rename
+    # is enough and keeps all metadata; fall back to copy+delete across mounts
+    try:
+        try:
+            os.replace(file_path, dest)
+        except OSError as exc:
+            if exc.errno != errno.EXDEV:
+                raise
+            import shutil  # only needed for this rare cross-filesystem move
+
+            shutil.move(str(file_path), str(dest))
+    except OSError:
+        # Release the reserved name so a failed move leaves no empty file behind
+        dest.unlink(missing_ok=True)
+        raise
 
     return dest
 
@@ -218,7 +262,7 @@ def main() -> int:
     if not project_root.is_dir():
         result = {"success": False, "error": f"Not a directory: {project_root}"}
         out.log_json(result, label="error")
-        print(json.dumps(result, separators=(",", ":")))
+        print(_dumps(result))
         out.close()
         return 1
 
@@ -231,7 +275,7 @@ def main() -> int:
             "space_saved": "0 B",
         }
         out.log_json(result, label="no-logs")
-        print(json.dumps(result, separators=(",", ":")))
+        print(_dumps(result))
         out.summary("DONE", "No logs directory found")
         out.close()
         return 0
@@ -239,7 +283,7 @@ def main() -> int:
     if not logs_dir.is_dir():
         result = {"success": False, "error": f"Not a directory: {logs_dir}"}
         out.log_json(result, label="error")
-        print(json.dumps(result, separators=(",", ":")))
+        print(_dumps(result))
         out.close()
         return 1
 
@@ -266,7 +310,7 @@ def main() -> int:
             "message": f"No log files older than {args.days} days found",
         }
         out.log_json(result, label="no-old-files")
-        print(json.dumps(result, separators=(",", ":")))
+        print(_dumps(result))
         out.summary("DONE", "No old log files found")
         out.close()
         return 0
@@ -278,40 +322,69 @@ def main() -> int:
     archive_root = get_archive_path(project_root)
     total_size = 0
     archived_count = 0
-    archived_files: list[dict[str, str]] = []
-
-    for file_path in old_files:
-        size = file_size_bytes(file_path)
-        mtime = file_mtime(file_path)
-
-        if args.dry_run:
-            month_label = mtime.strftime("%Y-%m")
-            if args.verbose:
-                print(
-                    f"  [DRY RUN] Would archive: {file_path.name} ({format_size(size)}) -> archive/{month_label}/",
-                    file=sys.stderr,
-                )
-            archived_files.append(
-                {
-                    "name": file_path.name,
-                    "size": format_size(size),
-                    "modified": mtime.isoformat(),
-                    "destination": f"archive/{month_label}/{file_path.name}",
-                }
-            )
-        else:
-            dest = archive_file(file_path, archive_root, verbose=args.verbose)
-            archived_files.append(
-                {
-                    "name": file_path.name,
-                    "size": format_size(size),
-                    "modified": mtime.isoformat(),
-                    "destination": str(dest),
-                }
-            )
-
-        total_size += size
-        archived_count += 1
+
+    # Per-file entries are streamed straight to stdout as one JSON object
+    # ({"files": [...], <summary keys>}) so the list is never held in memory
+    list_files = args.verbose or args.dry_run
+    if list_files:
+        sys.stdout.write('{"files":[')
+
+    # Group by target month so each archive/YYYY-MM/ is created only once
+    month_groups: dict[str, list[tuple[Path, os.stat_result, datetime]]] = {}
+    for file_path, st in old_files:
+        mtime = datetime.fromtimestamp(st.st_mtime, tz=timezone.utc)
+        month_groups.setdefault(mtime.strftime("%Y-%m"), []).append(
+            (file_path, st, mtime)
+        )
+
+    try:
+        for month_label, month_files in month_groups.items():
+            month_dir = archive_root / month_label
+            if not args.dry_run:
+                month_dir.mkdir(parents=True, exist_ok=True)
+
+            for file_path, st, mtime in month_files:
+                size = st.st_size
+
+                if args.dry_run:
+                    if args.verbose:
+                        print(
+                            f"  [DRY RUN] Would archive: {file_path.name} ({format_size(size)}) -> archive/{month_label}/",
+                            file=sys.stderr,
+                        )
+                    destination = f"archive/{month_label}/{file_path.name}"
+                else:
+                    dest = archive_file(file_path, month_dir, verbose=args.verbose)
+                    destination = str(dest)
+
+                if list_files:
+                    entry = _dumps(
+                        {
+                            "name": file_path.name,
+                            "size": format_size(size),
+                            "modified": mtime.isoformat(),
+                            "destination": destination,
+                        }
+                    )
+                    sys.stdout.write(("," if archived_count else "") + entry)
+                    out.log(entry)
+
+                total_size += size
+                archived_count += 1
+    except Exception as exc:
+        # Keep stdout a complete JSON document even when a move fails midway
+        error_out = {
+            "success": False,
+            "error": str(exc),
+            "files_archived": archived_count,
+            "space_saved": format_size(total_size),
+            "space_saved_bytes": total_size,
+        }
+        out.log_json(error_out, label="error")
+        error_json = _dumps(error_out)
+        print("]," + error_json[1:] if list_files else error_json)
+        out.close()
+        return 1
 
     result_out: dict[str, Any] = {
         "success": True,
@@ -323,11 +396,13 @@ def main() -> int:
         "cutoff_date": cutoff.isoformat(),
     }
 
-    if args.verbose or args.dry_run:
-        result_out["files"] = archived_files
-
     out.log_json(result_out, label="archive-result")
-    print(json.dumps(result_out, separators=(",", ":")))
+    result_json = _dumps(result_out)
+    if list_files:
+        # Close the files array and splice the summary keys into the same object
+        print("]," + result_json[1:])
+    else:
+        print(result_json)
     out.summary("DONE", f"Archived {archived_count} file(s), saved {format_size(total_size)}")
     out.close()
     return 0
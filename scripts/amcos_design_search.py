@@ -7,20 +7,53 @@ Searches .md files in the design/ directory, parsing YAML frontmatter
 status, title, author, date. Supports filtering by keyword, document type,
 status, and UUID prefix match. Output in text table or JSON format.
 
+Extracted metadata is cached across runs in ~/.cache/amcos/design_index.json
+(keyed by path, mtime and size), so unchanged documents are not re-read.
+Pass --no-cache to bypass it.
+
 Dependencies: Python 3.8+ stdlib only
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 from amcos_output_utils import AmcosOutput
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+# Bytes read from the start of each document to find its frontmatter and title
+HEADER_BYTES = 8192
+
+# Default worker count for the per-file scan (I/O bound, so above CPU count)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) * 4)
+
+# Persistent metadata cache, shared by all projects (keys are absolute paths)
+CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "amcos"
+    / "design_index.json"
+)
+
+# key: value frontmatter lines; comment and blank lines never match the key class
+_KV_RE = re.compile(
+    r"^[ \t]*([a-zA-Z_][a-zA-Z0-9_-]*)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE
+)
+# uuid: value line in raw frontmatter bytes, for the --uuid fast path
+_UUID_LINE_RE = re.compile(rb"^[ \t]*uuid[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
 # =============================================================================
 # Data Structures
 # =============================================================================
@@ -46,56 +79,109 @@ class DesignDocMeta:
 # =============================================================================
 
 
-def _parse_frontmatter(content: str) -> dict[str, str]:
-    """Parse YAML frontmatter from a markdown file using regex (no PyYAML).
+def _find_frontmatter(data: bytes) -> tuple[int, int, int]:
+    """Locate the frontmatter block delimited by --- lines at the start of a file.
+
+    Uses bytes.find rather than a regex over the decoded text. Returns
+    (start, end, body_start): the frontmatter is data[start:end] and the body
+    begins at body_start. All three are 0 when there is no complete block.
+    """
+    if not data.startswith(b"---"):
+        return 0, 0, 0
+    first_nl = data.find(b"\n")
+    if first_nl < 0 or data[3:first_nl].strip():
+        return 0, 0, 0
+
+    pos = first_nl
+    while True:
+        pos = data.find(b"\n---", pos)
+        if pos < 0:
+            return 0, 0, 0
+        line_end = data.find(b"\n", pos + 4)
+        if line_end < 0:
+            return 0, 0, 0
+        if not data[pos + 4 : line_end].strip():
+            return first_nl + 1, pos, line_end + 1
+        pos = line_end
+
+
+def _find_h1(data: bytes, pos: int = 0) -> str:
+    """Return the text of the first '# ' header line at or after ``pos``."""
+    if pos:
+        pos -= 1  # let the "\n#" search below match a header right at pos
+    elif data.startswith(b"#"):
+        pos = -1  # header on the very first line
+    while True:
+        if pos >= 0:
+            pos = data.find(b"\n#", pos)
+            if pos < 0:
+                return ""
+        start = pos + 2
+        if data[start : start + 1] in (b" ", b"\t"):
+            end = data.find(b"\n", start)
+            title = data[start : end if end >= 0 else len(data)]
+            title = title.decode("utf-8", "replace").strip()
+            if title:
+                return title
+        pos = start
+
+
+def _uuid_may_match(data: bytes, is_complete: bool, uuid_prefix: str) -> bool:
+    """Cheaply check a document's uuid against a prefix before a full parse.
+
+    Returns False only when the document certainly does not match; when the
+    frontmatter cannot be located in a partial header it returns True so the
+    caller falls back to the full parse.
+    """
+    start, end, body_start = _find_frontmatter(data)
+    if not body_start:
+        return not is_complete and data.startswith(b"---")
+    frontmatter = data[start:end]
+    if frontmatter.find(b"uuid") < 0:
+        return False
+    value = b""
+    for match in _UUID_LINE_RE.finditer(frontmatter):
+        value = match.group(1)  # last definition wins, as in _parse_frontmatter
+    if value[:1] in (b"'", b'"') and value[-1:] == value[:1]:
+        value = value[1:-1]
+    return value.decode("utf-8", "replace").lower().startswith(uuid_prefix.lower())
+
+
+def _parse_frontmatter(frontmatter_text: str) -> dict[str, str]:
+    """Parse YAML frontmatter key: value lines using regex (no PyYAML).
 
-    Expects frontmatter delimited by --- at the start of the file.
     Handles simple key: value pairs only (no nested structures).
 
     Returns a dict of key-value pairs. Values are always strings.
     """
-    # Match YAML frontmatter block at the start of the file
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n", content, re.DOTALL)
-    if not match:
-        return {}
-
-    frontmatter_text = match.group(1)
     result: dict[str, str] = {}
 
-    for line in frontmatter_text.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        # Match key: value (with optional quotes around value)
-        kv_match = re.match(r"^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:\s*(.*)$", line)
-        if kv_match:
-            key = kv_match.group(1).strip()
-            value = kv_match.group(2).strip()
-            # Strip surrounding quotes if present
-            if (value.startswith('"') and value.endswith('"')) or (
-                value.startswith("'") and value.endswith("'")
-            ):
-                value = value[1:-1]
-            result[key] = value
+    for kv_match in _KV_RE.finditer(frontmatter_text):
+        key, value = kv_match.group(1, 2)
+        # Strip surrounding quotes if present
+        if value[:1] in ("'", '"') and value[-1:] == value[:1]:
+            value = value[1:-1]
+        result[key] = value
 
     return result
 
 
-def _extract_metadata(filepath: Path, content: str) -> DesignDocMeta:
-    """Extract metadata from a design document.
+def _extract_metadata(filepath: Path, data: bytes) -> DesignDocMeta:
+    """Extract metadata from a design document's raw bytes.
 
     Parses the YAML frontmatter and also tries to extract the title
-    from the first # header if not present in frontmatter.
+    from the first # header if not present in frontmatter. Only the
+    frontmatter slice and the header line are decoded.
     """
-    fm = _parse_frontmatter(content)
+    start, end, body_start = _find_frontmatter(data)
+    fm = (
+        _parse_frontmatter(data[start:end].decode("utf-8", "replace"))
+        if body_start
+        else {}
+    )
 
-    # If title is not in frontmatter, try to get it from the first # header
-    title = fm.get("title", "")
-    if not title:
-        # Look for first # header after frontmatter
-        title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-        if title_match:
-            title = title_match.group(1).strip()
+    # If title is not in frontmatter, take the first # header after it
+    title = fm.get("title", "") or _find_h1(data, body_start)
 
     return DesignDocMeta(
         filepath=str(filepath),
@@ -110,35 +196,199 @@ def _extract_metadata(filepath: Path, content: str) -> DesignDocMeta:
     )
 
 
+# =============================================================================
+# JSON Serialization
+# =============================================================================
+
+
+def _dumps(data: Any, indent: bool = False) -> str:
+    """Serialize data to JSON text, compact unless ``indent`` (orjson when installed)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2)
+    return json.dumps(data, separators=(",", ":"))
+
+
+# =============================================================================
+# Metadata Cache
+# =============================================================================
+
+
+def _load_cache(cache_path: Path) -> dict[str, dict[str, Any]]:
+    """Load the metadata cache. Returns an empty cache if missing or unreadable."""
+    try:
+        data = (orjson or json).loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_cache(cache_path: Path, cache: dict[str, dict[str, Any]]) -> None:
+    """Write the metadata cache atomically (best-effort)."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(_dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _cached_meta(
+    cache: dict[str, dict[str, Any]], doc_file: str, st: os.stat_result
+) -> DesignDocMeta | None:
+    """Return cached metadata for a document if its mtime and size are unchanged."""
+    entry = cache.get(doc_file)
+    if (
+        not entry
+        or entry.get("mtime_ns") != st.st_mtime_ns
+        or entry.get("size") != st.st_size
+    ):
+        return None
+    try:
+        return DesignDocMeta(**entry["meta"])
+    except (KeyError, TypeError):
+        return None
+
+
 # =============================================================================
 # Search Functions
 # =============================================================================
 
 
-def _find_design_docs(design_dir: Path) -> list[Path]:
-    """Find all .md files in the design directory recursively."""
-    if not design_dir.exists():
-        return []
-    return sorted(design_dir.rglob("*.md"))
+def _find_design_docs(design_dir: Path) -> list[str]:
+    """Find all .md files in the design directory recursively.
+
+    Walks the tree with os.scandir so each entry's cached type is used
+    instead of building a Path and stat()ing every visited file. Symlinked
+    directories are not descended into. Returns sorted path strings.
+    """
+    results: list[str] = []
+    stack = [str(design_dir)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        results.append(entry.path)
+        except OSError:
+            continue
+    # Sort by path components to keep the same order as sorted(Path, ...)
+    results.sort(key=lambda p: p.split(os.sep))
+    return results
+
+
+def _read_header(path: Path, nbytes: int = HEADER_BYTES) -> tuple[bytes, bool]:
+    """Read up to ``nbytes`` from the start of a file.
+
+    Returns (data, is_complete) where is_complete means the whole file was read.
+    """
+    with open(path, "rb") as f:
+        buf = f.read(nbytes)
+    return buf, len(buf) < nbytes
+
 
+def _compile_query(query: str) -> re.Pattern[str]:
+    """Compile a literal, case-insensitive pattern for a text query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
 
-def _matches_query(doc: DesignDocMeta, content: str, query: str) -> bool:
-    """Check if a document matches a text query (case-insensitive)."""
-    query_lower = query.lower()
-    # Search in title, filename, and full content
+
+def _matches_title(doc: DesignDocMeta, query_re: re.Pattern[str]) -> bool:
+    """Check if a query matches the document's title or filename."""
     return (
-        query_lower in doc.title.lower()
-        or query_lower in doc.filename.lower()
-        or query_lower in content.lower()
+        query_re.search(doc.title) is not None
+        or query_re.search(doc.filename) is not None
     )
 
 
+def _scan_one(
+    doc_file: str,
+    query_re: re.Pattern[str] | None,
+    doc_type: str | None,
+    status: str | None,
+    uuid_prefix: str | None,
+    cache: dict[str, dict[str, Any]] | None = None,
+) -> tuple[DesignDocMeta | None, dict[str, Any] | None]:
+    """Read one design document and check it against the filters.
+
+    Returns (meta, cache_entry): meta is None when the document is unreadable
+    or filtered out; cache_entry is a fresh cache record when the metadata
+    was parsed (not served from ``cache``) and caching is enabled.
+    """
+    doc_path = Path(doc_file)
+    data = b""
+    is_complete = False
+    meta = None
+    entry = None
+
+    if cache is not None:
+        try:
+            st = os.stat(doc_file)
+        except OSError:
+            return None, None
+        meta = _cached_meta(cache, doc_file, st)
+
+    if meta is None:
+        try:
+            data, is_complete = _read_header(doc_path)
+        except OSError:
+            return None, None
+        if uuid_prefix and not _uuid_may_match(data, is_complete, uuid_prefix):
+            return None, None
+        meta = _extract_metadata(doc_path, data)
+
+        # Frontmatter or title may lie past the header — fall back to the full file
+        if not is_complete and (
+            not meta.title or (data.startswith(b"---") and not meta.raw_frontmatter)
+        ):
+            try:
+                data = doc_path.read_bytes()
+            except OSError:
+                return None, None
+            meta = _extract_metadata(doc_path, data)
+            is_complete = True
+
+        if cache is not None:
+            entry = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "meta": asdict(meta),
+            }
+
+    # Apply metadata filters before touching the document body
+    if doc_type and meta.doc_type.lower() != doc_type.lower():
+        return None, entry
+    if status and meta.status.lower() != status.lower():
+        return None, entry
+    if uuid_prefix and not meta.uuid.lower().startswith(uuid_prefix.lower()):
+        return None, entry
+    if query_re is not None and not _matches_title(meta, query_re):
+        # Only the body is left to search — read the rest if needed
+        if not is_complete:
+            try:
+                data = doc_path.read_bytes()
+            except OSError:
+                return None, entry
+        content = data.decode("utf-8", "replace")
+        # IGNORECASE search avoids building a lowercased copy of the body
+        if query_re.search(content) is None:
+            return None, entry
+
+    return meta, entry
+
+
 def search_design_docs(
     project_root: Path,
     query: str | None = None,
     doc_type: str | None = None,
     status: str | None = None,
     uuid_prefix: str | None = None,
+    jobs: int | None = None,
+    cache_path: Path | None = None,
 ) -> list[DesignDocMeta]:
     """Search design documents by various criteria.
 
@@ -148,35 +398,45 @@ def search_design_docs(
         doc_type: Filter by document type (exact match, case-insensitive)
         status: Filter by document status (exact match, case-insensitive)
         uuid_prefix: Filter by UUID prefix match (case-insensitive)
+        jobs: Number of files to scan concurrently (default: DEFAULT_JOBS)
+        cache_path: Metadata cache file to read and update (default: no cache)
 
     Returns:
-        List of matching DesignDocMeta objects
+        List of matching DesignDocMeta objects, in sorted path order
     """
     design_dir = project_root / "design"
     docs = _find_design_docs(design_dir)
-    results: list[DesignDocMeta] = []
-
-    for doc_path in docs:
-        try:
-            content = doc_path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError):
-            continue
-
-        meta = _extract_metadata(doc_path, content)
+    cache = _load_cache(cache_path) if cache_path is not None else None
+    scan = functools.partial(
+        _scan_one,
+        query_re=_compile_query(query) if query else None,
+        doc_type=doc_type,
+        status=status,
+        uuid_prefix=uuid_prefix,
+        cache=cache,
+    )
 
-        # Apply filters
-        if doc_type and meta.doc_type.lower() != doc_type.lower():
-            continue
-        if status and meta.status.lower() != status.lower():
-            continue
-        if uuid_prefix and not meta.uuid.lower().startswith(uuid_prefix.lower()):
-            continue
-        if query and not _matches_query(meta, content, query):
-            continue
+    workers = min(jobs or DEFAULT_JOBS, len(docs))
+    if workers <= 1:
+        scanned = list(map(scan, docs))
+    else:
+        # executor.map preserves input order, so results stay sorted
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            scanned = list(executor.map(scan, docs))
 
-        results.append(meta)
+    if cache is not None and cache_path is not None:
+        # Drop entries for documents under design/ that no longer exist
+        prefix = str(design_dir) + os.sep
+        present = set(docs)
+        stale = [p for p in cache if p.startswith(prefix) and p not in present]
+        for doc_file in stale:
+            del cache[doc_file]
+        fresh = {doc_file: e for doc_file, (_, e) in zip(docs, scanned) if e}
+        if fresh or stale:
+            cache.update(fresh)
+            _save_cache(cache_path, cache)
 
-    return results
+    return [meta for meta, _ in scanned if meta is not None]
 
 
 # =============================================================================
@@ -228,7 +488,7 @@ def _print_json(results: list[DesignDocMeta]) -> None:
         # Remove raw_frontmatter from default output to keep it clean
         d.pop("raw_frontmatter", None)
         output.append(d)
-    print(json.dumps(output, indent=2))
+    print(_dumps(output, indent=True))
 
 
 # =============================================================================
@@ -279,6 +539,17 @@ def _create_parser() -> argparse.ArgumentParser:
         default="text",
         help="Output format (default: text)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Number of files to scan in parallel (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or update the metadata cache ({CACHE_PATH})",
+    )
     return parser
 
 
@@ -301,6 +572,8 @@ def main() -> int:
         doc_type=args.doc_type,
         status=args.status,
         uuid_prefix=args.uuid,
+        jobs=args.jobs,
+        cache_path=None if args.no_cache else CACHE_PATH,
     )
 
     if args.output_format == "json":
@@ -310,7 +583,7 @@ def main() -> int:
             d.pop("raw_frontmatter", None)
             output.append(d)
         out.log_json(output, label="search_results")
-        print(json.dumps(output, separators=(",", ":")))
+        print(_dumps(output))
     else:
         _print_text_table(results)
         out.log(f"Found {len(results)} document(s)")
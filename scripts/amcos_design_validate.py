@@ -5,7 +5,7 @@ Validates YAML frontmatter in markdown design documents for the AMCOS plugin.
 Uses ONLY Python stdlib -- no PyYAML or external dependencies required.
 
 Usage:
-    python amcos_design_validate.py PATH [--verbose] [--format {text,json}]
+    python amcos_design_validate.py PATH [--verbose] [--format {text,json}] [--cache]
 
 Exit codes:
     0 - All validated documents are valid
@@ -17,6 +17,7 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
 from amcos_output_utils import AmcosOutput
@@ -34,9 +35,12 @@ VALID_UUID_PREFIXES = ("REQ", "SPEC", "ARCH", "PDR", "HAND", "MEM", "DEC", "GUUI
 # Regex that matches the full UUID format (prefix is one of VALID_UUID_PREFIXES,
 # date part is exactly 8 digits, sequence part is exactly 4 digits)
 UUID_PATTERN = re.compile(r"^(" + "|".join(VALID_UUID_PREFIXES) + r")-(\d{8})-(\d{4})$")
+# Possible lengths of a well-formed uuid ("-YYYYMMDD-NNNN" is 14 characters),
+# checked before running the regex so malformed values are rejected cheaply
+UUID_LENGTHS = frozenset(len(prefix) + 14 for prefix in VALID_UUID_PREFIXES)
 
 # Valid status values (compared case-insensitively)
-VALID_STATUSES = {
+VALID_STATUSES = frozenset({
     "draft",
     "review",
     "approved",
@@ -46,21 +50,35 @@ VALID_STATUSES = {
     "implemented",
     "deprecated",
     "rejected",
-}
+})
+VALID_STATUSES_TEXT = ", ".join(sorted(VALID_STATUSES))
 
 # Valid type values (compared case-insensitively)
-VALID_TYPES = {
+VALID_TYPES = frozenset({
     "requirement",
     "specification",
     "architecture",
     "handoff",
     "memory",
     "decision",
-}
+})
+VALID_TYPES_TEXT = ", ".join(sorted(VALID_TYPES))
 
-# ISO 8601 date patterns: YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ
-DATE_ONLY_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
+# ISO 8601 date pattern: YYYY-MM-DD with an optional THH:MM:SSZ time part.
+# One fullmatch classifies both forms and captures every component.
+DATE_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})(?:T(\d{2}):(\d{2}):(\d{2})Z)?")
+# Lengths of the two accepted forms, checked before running the regex
+DATE_LENGTHS = (10, 20)
+
+# Persistent results cache used with --cache: abs path -> size, mtime, errors
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "amcos",
+    "design_validate.json",
+)
+
+# Below this many files, validate serially rather than pay process pool startup
+PARALLEL_MIN_FILES = 8
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +86,22 @@ DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
 # ---------------------------------------------------------------------------
 
 
+def _split_kv(stripped):
+    """Split a stripped frontmatter line into (key, value) on its first colon.
+
+    The key is lowercased and surrounding quotes (single or double) are
+    removed from the value. Returns None if the line has no colon.
+    """
+    key, sep, value = stripped.partition(":")
+    if not sep:
+        return None
+    value = value.lstrip()
+    # Strip surrounding quotes (single or double)
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        value = value[1:-1]
+    return key.rstrip().lower(), value
+
+
 def parse_frontmatter(filepath):
     """Parse YAML frontmatter from a markdown file.
 
@@ -82,39 +116,29 @@ def parse_frontmatter(filepath):
         ValueError: If the file has no frontmatter, frontmatter doesn't start
                     on line 1, or the closing delimiter is missing.
     """
+    frontmatter = {}
+    closed = False
+    # Stream line by line and stop at the closing delimiter, so the document
+    # body is never read
     with open(filepath, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    if not lines or lines[0].strip() != "---":
-        raise ValueError("No frontmatter found (file must start with '---' on line 1)")
-
-    # Find closing ---
-    closing_index = None
-    for i in range(1, len(lines)):
-        if lines[i].strip() == "---":
-            closing_index = i
-            break
-
-    if closing_index is None:
+        first = f.readline()
+        if first.strip() != "---":
+            raise ValueError("No frontmatter found (file must start with '---' on line 1)")
+
+        for line in f:
+            stripped = line.strip()
+            if stripped == "---":
+                closed = True
+                break
+            if not stripped:
+                continue
+            pair = _split_kv(stripped)
+            if pair is not None:
+                frontmatter[pair[0]] = pair[1]
+
+    if not closed:
         raise ValueError("Unclosed frontmatter (missing closing '---')")
 
-    # Parse key: value pairs between the delimiters
-    frontmatter = {}
-    for line in lines[1:closing_index]:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        # Split on first colon only
-        colon_pos = stripped.find(":")
-        if colon_pos == -1:
-            continue
-        key = stripped[:colon_pos].strip().lower()
-        value = stripped[colon_pos + 1 :].strip()
-        # Strip surrounding quotes (single or double)
-        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
-            value = value[1:-1]
-        frontmatter[key] = value
-
     return frontmatter
 
 
@@ -128,7 +152,7 @@ def validate_uuid(value):
 
     Returns an error message string if invalid, or None if valid.
     """
-    match = UUID_PATTERN.match(value)
+    match = UUID_PATTERN.match(value) if len(value) in UUID_LENGTHS else None
     if not match:
         return f"Invalid uuid format: '{value}' (expected PREFIX-YYYYMMDD-NNNN with prefix in {VALID_UUID_PREFIXES})"
     sequence = match.group(3)
@@ -142,9 +166,10 @@ def validate_status(value):
 
     Returns an error message string if invalid, or None if valid.
     """
-    if value.lower() not in VALID_STATUSES:
-        return f"Invalid status '{value}' (must be one of: {', '.join(sorted(VALID_STATUSES))})"
-    return None
+    # Most values are already lowercase; only lowercase a copy when they aren't
+    if value in VALID_STATUSES or value.lower() in VALID_STATUSES:
+        return None
+    return f"Invalid status '{value}' (must be one of: {VALID_STATUSES_TEXT})"
 
 
 def validate_type(value):
@@ -152,11 +177,9 @@ def validate_type(value):
 
     Returns an error message string if invalid, or None if valid.
     """
-    if value.lower() not in VALID_TYPES:
-        return (
-            f"Invalid type '{value}' (must be one of: {', '.join(sorted(VALID_TYPES))})"
-        )
-    return None
+    if value in VALID_TYPES or value.lower() in VALID_TYPES:
+        return None
+    return f"Invalid type '{value}' (must be one of: {VALID_TYPES_TEXT})"
 
 
 def parse_date(value):
@@ -170,14 +193,19 @@ def parse_date(value):
     Raises:
         ValueError: If the date format or value is invalid.
     """
-    if DATE_ONLY_PATTERN.match(value):
-        return datetime.strptime(value, "%Y-%m-%d")
-    elif DATETIME_PATTERN.match(value):
-        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
-    else:
+    match = DATE_PATTERN.fullmatch(value) if len(value) in DATE_LENGTHS else None
+    if not match:
         raise ValueError(
             f"Invalid date format: '{value}' (expected YYYY-MM-DD or YYYY-MM-DDTHH:MM:SSZ)"
         )
+    # Build the datetime from the captured components instead of having
+    # strptime re-interpret a format string
+    year, month, day, hour, minute, second = match.groups()
+    if hour is None:
+        return datetime(int(year), int(month), int(day))
+    return datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second)
+    )
 
 
 def validate_dates(created_str, updated_str):
@@ -254,6 +282,88 @@ def validate_document(filepath):
     return errors
 
 
+def _validate_all(md_files):
+    """Validate many documents, in parallel across processes when worthwhile.
+
+    Returns a list of errors lists in the order of md_files.
+    """
+    if len(md_files) < PARALLEL_MIN_FILES:
+        return [validate_document(filepath) for filepath in md_files]
+
+    workers = os.cpu_count() or 1
+    # Batch files per task so IPC overhead stays small relative to the work
+    chunksize = max(1, min(32, len(md_files) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_document, md_files, chunksize=chunksize))
+
+
+def validate_documents(md_files, cache=None):
+    """Validate many documents, reusing cached results for unchanged files.
+
+    If cache is a dict (see load_cache), files whose size and mtime match
+    their cache entry are not re-read, and entries for re-validated files are
+    updated in place.
+
+    Returns a list of (filepath, errors_list) tuples in the order of md_files.
+    """
+    if cache is None:
+        return list(zip(md_files, _validate_all(md_files)))
+
+    results = [None] * len(md_files)
+    pending = []  # (index, filepath, cache key, stat result or None)
+    for index, filepath in enumerate(md_files):
+        key = os.path.abspath(filepath)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            st = None
+        entry = cache.get(key)
+        if (
+            st is not None
+            and isinstance(entry, dict)
+            and entry.get("size") == st.st_size
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and isinstance(entry.get("errors"), list)
+        ):
+            results[index] = (filepath, entry["errors"])
+        else:
+            pending.append((index, filepath, key, st))
+
+    fresh = _validate_all([filepath for _, filepath, _, _ in pending])
+    for (index, filepath, key, st), errors in zip(pending, fresh):
+        results[index] = (filepath, errors)
+        # The stat was taken before validating, so a file edited meanwhile
+        # simply misses the cache next time
+        if st is not None:
+            cache[key] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "errors": errors}
+    return results
+
+
+def load_cache(cache_path):
+    """Load the validation cache. Returns an empty cache if missing or unreadable."""
+    try:
+        with open(cache_path, "rb") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_cache(cache_path, cache):
+    """Write the validation cache atomically (best-effort)."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # File Discovery
 # ---------------------------------------------------------------------------
@@ -277,12 +387,22 @@ def find_md_files(path):
     if os.path.isfile(path):
         return [os.path.abspath(path)]
 
-    # Directory: walk recursively
+    # Directory: walk recursively with os.scandir, using each entry's cached
+    # type. Like os.walk, symlinked directories are not descended into and
+    # unreadable directories are skipped.
     md_files = []
-    for root, _, files in os.walk(path):
-        for fname in files:
-            if fname.endswith(".md"):
-                md_files.append(os.path.abspath(os.path.join(root, fname)))
+    stack = [os.path.abspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        md_files.append(entry.path)
+        except OSError:
+            continue
 
     if not md_files:
         raise ValueError(f"No .md files found in directory: {path}")
@@ -378,6 +498,12 @@ def main():
         dest="output_format",
         help="Output format (default: text).",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        default=False,
+        help=f"Reuse results for files unchanged since the last cached run ({CACHE_PATH}).",
+    )
 
     args = parser.parse_args()
 
@@ -401,10 +527,12 @@ def main():
         return 1
 
     # Validate each file
-    results = []
-    for filepath in md_files:
-        errors = validate_document(filepath)
-        results.append((filepath, errors))
+    if args.cache:
+        cache = load_cache(CACHE_PATH)
+        results = validate_documents(md_files, cache)
+        save_cache(CACHE_PATH, cache)
+    else:
+        results = validate_documents(md_files)
 
     # Format and print output
     total = len(results)
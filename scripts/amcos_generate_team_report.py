@@ -10,6 +10,7 @@ Dependencies: Python 3.8+ stdlib only
 
 Usage:
     amcos_generate_team_report.py [--output FILE] [--format text|json|md]
+                                  [--cache-ttl SECONDS] [--no-cache]
 
 Exit codes:
     0 - Success
@@ -19,42 +20,173 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
 import os
 import sys
-import urllib.error
+import time
 import urllib.request
+import zlib
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from amcos_output_utils import AmcosOutput
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import urllib3
+except ImportError:  # urllib3 is optional — fall back to urllib.request
+    urllib3 = None  # type: ignore[assignment]
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
 DEFAULT_API_BASE = "http://localhost:23000"
+API_TIMEOUT = 10  # seconds
+
+# On-disk cache of GET /api/teams responses, one file per API base URL
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "amcos"
+DEFAULT_CACHE_TTL = 30  # seconds
+
+# Keep-alive connection pool shared by all API requests (urllib3 only)
+_HTTP = (
+    urllib3.PoolManager(
+        num_pools=4,
+        maxsize=8,
+        timeout=urllib3.Timeout(total=API_TIMEOUT),
+        retries=urllib3.Retry(3),
+    )
+    if urllib3 is not None
+    else None
+)
 
 # All roles that should be filled in a complete team
+# Interned so lookups against interned API strings compare by identity
 ALL_ROLES = frozenset(
-    {
-        "architect",
-        "orchestrator",
-        "integrator",
-        "programmer",
-    }
+    map(
+        sys.intern,
+        {
+            "architect",
+            "orchestrator",
+            "integrator",
+            "programmer",
+        },
+    )
+)
+# Sorted once so per-team missing-role lists keep this order without re-sorting
+ALL_ROLES_SORTED = tuple(sorted(ALL_ROLES))
+
+# Role coverage is tracked as a bitmask with one bit per role in ALL_ROLES_SORTED;
+# these tables give the sorted filled and missing roles for every mask value
+_ROLE_BIT = {role: 1 << i for i, role in enumerate(ALL_ROLES_SORTED)}
+_FILLED_BY_MASK = tuple(
+    tuple(role for role in ALL_ROLES_SORTED if mask & _ROLE_BIT[role])
+    for mask in range(1 << len(ALL_ROLES_SORTED))
+)
+_MISSING_BY_MASK = tuple(
+    tuple(role for role in ALL_ROLES_SORTED if not mask & _ROLE_BIT[role])
+    for mask in range(1 << len(ALL_ROLES_SORTED))
 )
 
 DEFAULT_FORMAT = "md"
 VALID_FORMATS = ("text", "json", "md")
 
 
+class Agent(NamedTuple):
+    """One agent's assignment as reported for a single team."""
+
+    name: str
+    role: str
+    team: str
+    status: str
+    plugin: str
+    host: str
+
+
+class TeamSummary(NamedTuple):
+    """Per-team summary of agents and role coverage."""
+
+    team_name: str
+    team_id: str
+    project: str
+    agent_count: int
+    agents: list[str]
+    roles_filled: list[str]
+    roles_missing: list[str]
+
+
+# Sort key and row template for the agent assignment matrix
+_AGENT_KEY = attrgetter("team", "role", "name")
+_AGENT_ROW = "| {0.name} | {0.role} | {0.team} | {0.status} |\n".format
+# Sort key for (agent name, teams) pairs in the multi-team listing
+_NAME_KEY = itemgetter(0)
+# Agent line template for the plain-text per-team listing
+_AGENT_LINE = "    - {}\n".format
+
+
 # ---------------------------------------------------------------------------
 # API data fetching
 # ---------------------------------------------------------------------------
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any, indent: bool = False) -> str:
+    """Serialize data to JSON text, compact unless indent (orjson when installed)."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(data, option=option, default=str).decode("utf-8")
+    if indent:
+        return json.dumps(data, indent=2, default=str)
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def _http_get(url: str, headers: dict[str, str]) -> bytes:
+    """GET a URL and return the response body.
+
+    Uses the pooled urllib3 connection when urllib3 is installed, otherwise
+    urllib.request. A gzip Content-Encoding is decoded either way (urllib3
+    does this itself).
+
+    Raises:
+        OSError: If the request fails or the server returns an error status.
+    """
+    if _HTTP is None:
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=API_TIMEOUT) as resp:
+            raw = resp.read()
+            encoding = resp.headers.get("Content-Encoding", "")
+        if encoding.lower() != "gzip":
+            return raw
+        try:
+            return gzip.decompress(raw)
+        except (EOFError, zlib.error) as exc:  # BadGzipFile is already an OSError
+            raise OSError(f"Invalid gzip response: {exc}") from exc
+
+    try:
+        resp = _HTTP.request("GET", url, headers=headers)
+    except urllib3.exceptions.HTTPError as exc:
+        raise OSError(str(exc)) from exc
+    if resp.status >= 400:
+        raise OSError(f"HTTP Error {resp.status}: {resp.reason}")
+    return resp.data
+
+
 def fetch_teams_from_api(api_base: str) -> list[dict[str, Any]]:
     """Fetch team data from the AI Maestro REST API.
 
@@ -71,18 +203,20 @@ def fetch_teams_from_api(api_base: str) -> list[dict[str, Any]]:
     """
     url = f"{api_base}/api/teams"
     try:
-        req = urllib.request.Request(url, headers={"Accept": "application/json"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            raw = resp.read().decode("utf-8")
-    except urllib.error.URLError as exc:
+        raw = _http_get(
+            url, {"Accept": "application/json", "Accept-Encoding": "gzip"}
+        )
+    except OSError as exc:  # includes urllib.error.URLError
         print(
             f"ERROR: Cannot connect to AI Maestro API at {url}: {exc}", file=sys.stderr
         )
         sys.exit(1)
 
+    # Parse the response bytes directly; both parsers detect the encoding and
+    # raise a ValueError subclass on malformed JSON or invalid UTF-8
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError as exc:
+        data = _json_loads(raw)
+    except ValueError as exc:
         print(f"ERROR: Invalid JSON from API at {url}: {exc}", file=sys.stderr)
         sys.exit(1)
 
@@ -98,11 +232,68 @@ def fetch_teams_from_api(api_base: str) -> list[dict[str, Any]]:
     sys.exit(1)
 
 
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+def _teams_cache_path(api_base: str) -> Path:
+    """Return the cache file for an API base URL."""
+    digest = hashlib.blake2b(api_base.encode("utf-8"), digest_size=8).hexdigest()
+    return CACHE_DIR / f"teams-{digest}.json.gz"
+
+
+def _load_cached_teams(cache_path: Path, ttl: float) -> list[dict[str, Any]] | None:
+    """Return cached teams if the cache file is younger than ttl seconds.
+
+    Returns None on a missing, stale, or unreadable cache.
+    """
+    try:
+        if cache_path.stat().st_mtime <= time.time() - ttl:
+            return None
+        data = _json_loads(gzip.decompress(cache_path.read_bytes()))
+    except (OSError, ValueError, EOFError, zlib.error):
+        return None
+    return data if isinstance(data, list) else None
+
+
+def _save_cached_teams(cache_path: Path, teams: list[dict[str, Any]]) -> None:
+    """Write teams to the cache gzip-compressed and atomically (best-effort)."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(gzip.compress(_dumps(teams).encode("utf-8"), 6))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _write_report(output_path: Path, data: bytes) -> None:
+    """Write the encoded report plus a trailing newline atomically.
+
+    The newline is written separately so the report bytes are never copied.
+    """
+    tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.write(b"\n")
+        os.replace(tmp_path, output_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 # ---------------------------------------------------------------------------
 # Aggregation
 # ---------------------------------------------------------------------------
 
 
+def _intern(value: Any) -> Any:
+    """Intern str values so repeated names share one object; pass others through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 def aggregate_registries(
     registries: list[dict[str, Any]],
 ) -> dict[str, Any]:
@@ -115,69 +306,88 @@ def aggregate_registries(
         Aggregated report data dict.
     """
     total_agents = 0
-    all_agents: list[dict[str, Any]] = []
-    team_summaries: list[dict[str, Any]] = []
-    agent_assignments: dict[str, list[str]] = {}  # agent_name -> list of team names
-    all_filled_roles: set[str] = set()
-
+    all_agents: list[Agent] = []
+    team_summaries: list[TeamSummary] = []
+    # agent_name -> list of team names
+    agent_assignments: defaultdict[str, list[str]] = defaultdict(list)
+    all_roles_mask = 0
+    add_agent = all_agents.append
+    role_bit = _ROLE_BIT.get
+
+    # Fallback keys are only looked up when the primary key is absent, rather
+    # than building the fallback default on every call
     for data in registries:
-        team_name = data.get("team_name", data.get("name", "unknown"))
-        agents = data.get("agents", data.get("roster", []))
-        project = data.get("project", data.get("repository", ""))
+        team_name = _intern(
+            data["team_name"] if "team_name" in data else data.get("name", "unknown")
+        )
+        agents = data["agents"] if "agents" in data else data.get("roster", [])
+        project = (
+            data["project"] if "project" in data else data.get("repository", "")
+        )
 
-        team_roles: set[str] = set()
+        roles_mask = 0
+        # Roles outside ALL_ROLES still count as filled for the team
+        other_roles: set[str] = set()
         team_agent_names: list[str] = []
+        add_name = team_agent_names.append
 
         for agent in agents:
-            agent_name = agent.get("name", agent.get("agent_name", "unknown"))
-            role = agent.get("role", "unknown")
-            status = agent.get("status", "unknown")
-
-            total_agents += 1
-            team_roles.add(role)
-            all_filled_roles.add(role)
-            team_agent_names.append(agent_name)
-
-            all_agents.append(
-                {
-                    "name": agent_name,
-                    "role": role,
-                    "team": team_name,
-                    "status": status,
-                    "plugin": agent.get("plugin", ""),
-                    "host": agent.get("host", ""),
-                }
+            get = agent.get
+            agent_name = _intern(
+                agent["name"] if "name" in agent else get("agent_name", "unknown")
+            )
+            role = _intern(get("role", "unknown"))
+
+            bit = role_bit(role, 0)
+            if bit:
+                roles_mask |= bit
+            else:
+                other_roles.add(role)
+            add_name(agent_name)
+            add_agent(
+                Agent(
+                    agent_name,
+                    role,
+                    team_name,
+                    _intern(get("status", "unknown")),
+                    get("plugin", ""),
+                    get("host", ""),
+                )
             )
 
             # Track agent -> teams mapping
-            if agent_name not in agent_assignments:
-                agent_assignments[agent_name] = []
             agent_assignments[agent_name].append(team_name)
 
-        missing_roles = sorted(ALL_ROLES - team_roles)
+        total_agents += len(agents)
+        all_roles_mask |= roles_mask
+        roles_filled = (
+            sorted(other_roles.union(_FILLED_BY_MASK[roles_mask]))
+            if other_roles
+            else list(_FILLED_BY_MASK[roles_mask])
+        )
         # Use the API-provided team id or name as the identifier
-        team_id = data.get("id", data.get("team_id", team_name))
+        team_id = data["id"] if "id" in data else data.get("team_id", team_name)
 
         team_summaries.append(
-            {
-                "team_name": team_name,
-                "team_id": str(team_id),
-                "project": project,
-                "agent_count": len(agents),
-                "agents": team_agent_names,
-                "roles_filled": sorted(team_roles),
-                "roles_missing": missing_roles,
-            }
+            TeamSummary(
+                team_name,
+                str(team_id),
+                project,
+                len(agents),
+                team_agent_names,
+                roles_filled,
+                list(_MISSING_BY_MASK[roles_mask]),
+            )
         )
 
-    unassigned_roles_global = sorted(ALL_ROLES - all_filled_roles)
+    unassigned_roles_global = list(_MISSING_BY_MASK[all_roles_mask])
 
     return {
         "total_teams": len(registries),
         "total_agents": total_agents,
         "teams": team_summaries,
         "agents": all_agents,
-        "agent_assignments": agent_assignments,
+        "agent_assignments": dict(agent_assignments),
         "unassigned_roles_global": unassigned_roles_global,
     }
 
@@ -187,74 +397,76 @@ def aggregate_registries(
 # ---------------------------------------------------------------------------
 
 
-def format_json(report: dict[str, Any]) -> str:
-    """Format report as JSON."""
+def format_json(report: dict[str, Any], generated_at: datetime | None = None) -> str:
+    """Format report as JSON, stamped with generated_at (default: now)."""
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
     output = {
         "success": True,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "report": report,
+        "generated_at": generated_at.isoformat(),
+        # Team and agent records are tuples; emit them as objects
+        "report": {
+            **report,
+            "teams": [t._asdict() for t in report["teams"]],
+            "agents": [a._asdict() for a in report["agents"]],
+        },
     }
-    return json.dumps(output, indent=2, default=str)
-
-
-def format_markdown(report: dict[str, Any]) -> str:
-    """Format report as Markdown."""
-    lines: list[str] = []
-    lines.append("# Team Assignments Report")
-    lines.append("")
-    lines.append(
-        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+    return _dumps(output, indent=True)
+
+
+def format_markdown(report: dict[str, Any], generated_at: datetime | None = None) -> str:
+    """Format report as Markdown, stamped with generated_at (default: now)."""
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
+    # Each write covers a whole line or block, newlines included
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        "# Team Assignments Report\n\n"
+        f"Generated: {generated_at:%Y-%m-%d %H:%M:%S UTC}\n\n"
     )
-    lines.append("")
 
     # Summary
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- **Total teams**: {report['total_teams']}")
-    lines.append(f"- **Total agents**: {report['total_agents']}")
+    w(
+        "## Summary\n\n"
+        f"- **Total teams**: {report['total_teams']}\n"
+        f"- **Total agents**: {report['total_agents']}\n"
+    )
     if report["unassigned_roles_global"]:
-        lines.append(
-            f"- **Globally unassigned roles**: {', '.join(report['unassigned_roles_global'])}"
+        w(
+            f"- **Globally unassigned roles**: {', '.join(report['unassigned_roles_global'])}\n"
         )
     else:
-        lines.append("- **All roles assigned** across at least one team")
-    lines.append("")
+        w("- **All roles assigned** across at least one team\n")
 
     # Per-team breakdown
-    lines.append("## Per-Team Breakdown")
-    lines.append("")
+    w("\n## Per-Team Breakdown\n\n")
 
+    # One write per team; optional lines collapse to empty strings
     for team in report["teams"]:
-        lines.append(f"### {team['team_name']}")
-        lines.append("")
-        if team["project"]:
-            lines.append(f"- **Project**: {team['project']}")
-        lines.append(f"- **Team ID**: `{team['team_id']}`")
-        lines.append(f"- **Agent count**: {team['agent_count']}")
-        lines.append(
-            f"- **Roles filled**: {', '.join(team['roles_filled']) if team['roles_filled'] else 'none'}"
+        project_line = f"- **Project**: {team.project}\n" if team.project else ""
+        missing_line = (
+            f"- **Roles missing**: {', '.join(team.roles_missing)}\n"
+            if team.roles_missing
+            else ""
         )
-        if team["roles_missing"]:
-            lines.append(f"- **Roles missing**: {', '.join(team['roles_missing'])}")
-        lines.append(
-            f"- **Agents**: {', '.join(team['agents']) if team['agents'] else 'none'}"
+        w(
+            f"### {team.team_name}\n\n"
+            f"{project_line}"
+            f"- **Team ID**: `{team.team_id}`\n"
+            f"- **Agent count**: {team.agent_count}\n"
+            f"- **Roles filled**: {', '.join(team.roles_filled) if team.roles_filled else 'none'}\n"
+            f"{missing_line}"
+            f"- **Agents**: {', '.join(team.agents) if team.agents else 'none'}\n\n"
         )
-        lines.append("")
 
     # Agent assignment matrix
-    lines.append("## Agent Assignment Matrix")
-    lines.append("")
+    w("## Agent Assignment Matrix\n\n")
 
     if report["agents"]:
-        lines.append("| Agent | Role | Team | Status |")
-        lines.append("|-------|------|------|--------|")
-        for agent in sorted(
-            report["agents"], key=lambda a: (a["team"], a["role"], a["name"])
-        ):
-            lines.append(
-                f"| {agent['name']} | {agent['role']} | {agent['team']} | {agent['status']} |"
-            )
-        lines.append("")
+        w("| Agent | Role | Team | Status |\n|-------|------|------|--------|\n")
+        buf.writelines(map(_AGENT_ROW, sorted(report["agents"], key=_AGENT_KEY)))
+        w("\n")
 
         # Multi-team agents
         multi_team = {
@@ -263,68 +475,67 @@ def format_markdown(report: dict[str, Any]) -> str:
             if len(teams) > 1
         }
         if multi_team:
-            lines.append("### Multi-Team Agents")
-            lines.append("")
-            for name, teams in sorted(multi_team.items()):
-                lines.append(f"- **{name}**: {', '.join(teams)}")
-            lines.append("")
+            w("### Multi-Team Agents\n\n")
+            for name, teams in sorted(multi_team.items(), key=_NAME_KEY):
+                w(f"- **{name}**: {', '.join(teams)}\n")
+            w("\n")
     else:
-        lines.append("No agents found in any team registry.")
-        lines.append("")
+        w("No agents found in any team registry.\n\n")
 
     # Unassigned roles
-    lines.append("## Unassigned Roles")
-    lines.append("")
+    w("## Unassigned Roles\n\n")
 
     any_missing = False
     for team in report["teams"]:
-        if team["roles_missing"]:
+        if team.roles_missing:
             any_missing = True
-            lines.append(
-                f"- **{team['team_name']}**: {', '.join(team['roles_missing'])}"
-            )
+            w(f"- **{team.team_name}**: {', '.join(team.roles_missing)}\n")
 
     if not any_missing:
-        lines.append("All roles are filled in all teams.")
-    lines.append("")
-
-    return "\n".join(lines)
-
-
-def format_text(report: dict[str, Any]) -> str:
-    """Format report as plain text."""
-    lines: list[str] = []
-    lines.append("TEAM ASSIGNMENTS REPORT")
-    lines.append("=" * 60)
-    lines.append("")
-    lines.append(
-        f"Generated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}"
+        w("All roles are filled in all teams.\n")
+
+    return buf.getvalue()
+
+
+def format_text(report: dict[str, Any], generated_at: datetime | None = None) -> str:
+    """Format report as plain text, stamped with generated_at (default: now)."""
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
+    buf = io.StringIO()
+    w = buf.write
+    w(
+        f"TEAM ASSIGNMENTS REPORT\n{'=' * 60}\n\n"
+        f"Generated: {generated_at:%Y-%m-%d %H:%M:%S UTC}\n"
+        f"Total teams: {report['total_teams']}\n"
+        f"Total agents: {report['total_agents']}\n\n"
     )
-    lines.append(f"Total teams: {report['total_teams']}")
-    lines.append(f"Total agents: {report['total_agents']}")
-    lines.append("")
 
+    # One write per team; optional lines collapse to empty strings
     for team in report["teams"]:
-        lines.append(f"--- {team['team_name']} ---")
-        if team["project"]:
-            lines.append(f"  Project: {team['project']}")
-        lines.append(f"  Agents ({team['agent_count']}):")
-        for agent_name in team["agents"]:
-            lines.append(f"    - {agent_name}")
-        lines.append(f"  Roles filled: {', '.join(team['roles_filled'])}")
-        if team["roles_missing"]:
-            lines.append(f"  Roles missing: {', '.join(team['roles_missing'])}")
-        lines.append("")
+        project_line = f"  Project: {team.project}\n" if team.project else ""
+        agent_lines = "".join(map(_AGENT_LINE, team.agents))
+        missing_line = (
+            f"  Roles missing: {', '.join(team.roles_missing)}\n"
+            if team.roles_missing
+            else ""
+        )
+        w(
+            f"--- {team.team_name} ---\n"
+            f"{project_line}"
+            f"  Agents ({team.agent_count}):\n"
+            f"{agent_lines}"
+            f"  Roles filled: {', '.join(team.roles_filled)}\n"
+            f"{missing_line}\n"
+        )
 
     if report["unassigned_roles_global"]:
-        lines.append(
-            f"GLOBALLY UNASSIGNED ROLES: {', '.join(report['unassigned_roles_global'])}"
+        w(
+            f"GLOBALLY UNASSIGNED ROLES: {', '.join(report['unassigned_roles_global'])}\n"
         )
     else:
-        lines.append("All roles assigned across at least one team.")
-    lines.append("")
+        w("All roles assigned across at least one team.\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -368,6 +579,18 @@ def main() -> int:
         action="store_true",
         help="Print progress to stderr",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        metavar="SECONDS",
+        help=f"Reuse team data fetched within this many seconds; 0 disables the cache (default: {DEFAULT_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always fetch from the API and do not update the cache ({CACHE_DIR})",
+    )
 
     args = parser.parse_args()
 
@@ -375,14 +598,31 @@ def main() -> int:
     api_base = args.api or os.environ.get("AIMAESTRO_API", DEFAULT_API_BASE)
     api_base = api_base.rstrip("/")
 
-    if args.verbose:
-        print(f"Fetching team data from: {api_base}/api/teams", file=sys.stderr)
+    cache_path = (
+        None
+        if args.no_cache or args.cache_ttl <= 0
+        else _teams_cache_path(api_base)
+    )
+    teams = (
+        _load_cached_teams(cache_path, args.cache_ttl)
+        if cache_path is not None
+        else None
+    )
 
-    # Fetch teams from the REST API (exits on connection error)
-    teams = fetch_teams_from_api(api_base)
+    if teams is not None:
+        if args.verbose:
+            print(f"Using {len(teams)} cached team(s) from: {cache_path}", file=sys.stderr)
+    else:
+        if args.verbose:
+            print(f"Fetching team data from: {api_base}/api/teams", file=sys.stderr)
 
-    if args.verbose:
-        print(f"Received {len(teams)} team(s) from API", file=sys.stderr)
+        # Fetch teams from the REST API (exits on connection error)
+        teams = fetch_teams_from_api(api_base)
+
+        if args.verbose:
+            print(f"Received {len(teams)} team(s) from API", file=sys.stderr)
+        if cache_path is not None:
+            _save_cached_teams(cache_path, teams)
 
     if not teams:
         result = {
@@ -394,12 +634,12 @@ def main() -> int:
                 "teams": [],
                 "agents": [],
                 "agent_assignments": {},
-                "unassigned_roles_global": sorted(ALL_ROLES),
+                "unassigned_roles_global": list(ALL_ROLES_SORTED),
             },
         }
         if args.format == "json":
             out.log_json(result, label="empty-report")
-            print(json.dumps(result, separators=(",", ":")))
+            print(_dumps(result))
         else:
             out.log("No teams returned by the AI Maestro API.")
         out.summary("DONE", "No teams found")
@@ -409,19 +649,20 @@ def main() -> int:
     # Aggregate
     report = aggregate_registries(teams)
 
-    # Format output
+    # Format output, using one timestamp for the whole report
+    generated_at = datetime.now(timezone.utc)
     if args.format == "json":
-        output_text = format_json(report)
+        output_text = format_json(report, generated_at)
     elif args.format == "md":
-        output_text = format_markdown(report)
+        output_text = format_markdown(report, generated_at)
     else:
-        output_text = format_text(report)
+        output_text = format_text(report, generated_at)
 
     # Write or print
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output_text + "\n", encoding="utf-8")
+        _write_report(output_path, output_text.encode("utf-8"))
         if args.verbose:
             out.log(f"Wrote report to: {output_path}")
         # Print a brief summary to stdout
@@ -432,7 +673,7 @@ def main() -> int:
             "output_file": str(output_path),
         }
         out.log_json(summary, label="summary")
-        print(json.dumps(summary, separators=(",", ":")))
+        print(_dumps(summary))
     else:
         out.log(output_text)
 
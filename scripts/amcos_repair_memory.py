@@ -15,8 +15,12 @@ Dependencies: Python 3.8+ stdlib only
 from __future__ import annotations
 
 import argparse
+import io
+import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -42,6 +46,30 @@ REQUIRED_SECTIONS: dict[str, list[str]] = {
     "patterns": [],
 }
 
+# Sidecar in design/memory/ recording (mtime_ns, size) of files last found
+# healthy, so unchanged files are not re-read on the next run
+STAMP_FILENAME = ".amcos-repair-stamp"
+
+# Section names recognised as headers even when written without the "## " prefix.
+# Memory files are processed as UTF-8 bytes, so these are bytes too.
+_KNOWN_SECTIONS = frozenset(
+    {
+        b"Current Focus",
+        b"Active Decisions",
+        b"Recent Errors",
+        b"In-Flight Errors",
+        b"Completed",
+        b"In Progress",
+        b"General",
+        b"Patterns & Conventions",
+        b"Progress Log",
+        b"Active Context",
+    }
+)
+
+# A "## " section header line
+_SECTION_RE = re.compile(rb"^(## .+)$", re.MULTILINE)
+
 # Default content templates used when creating missing files from scratch.
 TEMPLATES: dict[str, str] = {
     "activeContext": """# Active Context
@@ -109,6 +137,18 @@ class RepairReport:
         return len(self.unrecoverable) > 0
 
 
+@dataclass
+class FileRepairResult:
+    """Outcome of checking and repairing a single memory file."""
+
+    actions: list[RepairAction] = field(default_factory=list)
+    unrecoverable: list[str] = field(default_factory=list)
+    # Verbose progress lines, printed by the caller in file order
+    messages: list[str] = field(default_factory=list)
+    # Known-good stamp entry for the file, or None if it should be dropped
+    stamp: list[int] | None = None
+
+
 # =============================================================================
 # Repair Functions
 # =============================================================================
@@ -119,101 +159,121 @@ def _get_timestamp() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M")
 
 
-def _read_file(path: Path) -> str:
-    """Read file content. Returns empty string if file does not exist or cannot be read."""
-    try:
-        return path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
-        return ""
-
+def _read_file(path: Path) -> bytes:
+    """Read file content as UTF-8 bytes with newlines normalized to LF.
 
-def _write_file(path: Path, content: str) -> bool:
-    """Write content to file. Creates parent directories if needed."""
+    Returns empty bytes if the file does not exist, cannot be read, or is not
+    valid UTF-8.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return b""
+    # Pure-ASCII content (the usual case) is valid UTF-8 without a decode pass
+    if not data.isascii():
+        try:
+            data.decode("utf-8")
+        except UnicodeDecodeError:
+            return b""
+    # Same newline translation as reading in text mode
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def _write_file(path: Path, data: bytes) -> bool:
+    """Write bytes to file atomically. The parent directory must exist.
+
+    The content is written to a sibling temp file which then replaces the
+    target, so an interrupted repair never leaves a half-written memory file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    view = memoryview(data)
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
         return True
     except OSError as e:
+        try:
+            tmp_path.unlink(missing_ok=True)
+        except OSError:
+            pass
         print(f"ERROR: Cannot write {path}: {e}", file=sys.stderr)
         return False
 
 
-def _fix_malformed_headers(content: str) -> tuple[str, list[str]]:
+def _load_stamp(stamp_path: Path) -> dict[str, list[int]]:
+    """Load the known-good stamp. Returns an empty stamp if missing or unreadable."""
+    try:
+        data = json.loads(stamp_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _fix_malformed_headers(content: bytes) -> tuple[bytes, list[str]]:
     """Fix markdown headers that are missing the ## prefix.
 
     Looks for lines that match known section names but lack proper markdown header syntax.
     Returns the fixed content and a list of descriptions of what was fixed.
     """
     fixes: list[str] = []
-    known_sections = [
-        "Current Focus",
-        "Active Decisions",
-        "Recent Errors",
-        "In-Flight Errors",
-        "Completed",
-        "In Progress",
-        "General",
-        "Patterns & Conventions",
-        "Progress Log",
-        "Active Context",
-    ]
-    lines = content.split("\n")
-    new_lines: list[str] = []
-    for line in lines:
+    lines = content.split(b"\n")
+    for i, line in enumerate(lines):
         stripped = line.strip()
         # Check if the line is a known section name without markdown header prefix
-        if stripped in known_sections and not stripped.startswith("#"):
-            new_lines.append(f"## {stripped}")
-            fixes.append(f"Fixed malformed header: '{stripped}' -> '## {stripped}'")
-        else:
-            new_lines.append(line)
-    return "\n".join(new_lines), fixes
+        # (no known name starts with "#", so membership alone rules out headers)
+        if stripped in _KNOWN_SECTIONS:
+            lines[i] = b"## " + stripped
+            name = stripped.decode("ascii")
+            fixes.append(f"Fixed malformed header: '{name}' -> '## {name}'")
+    if not fixes:
+        return content, fixes
+    return b"\n".join(lines), fixes
 
 
-def _remove_duplicate_sections(content: str) -> tuple[str, list[str]]:
+def _remove_duplicate_sections(content: bytes) -> tuple[bytes, list[str]]:
     """Remove duplicate ## sections, keeping only the first occurrence of each.
 
     Returns the fixed content and a list of descriptions of what was removed.
     """
-    fixes: list[str] = []
-    # Split content into sections by ## headers
-    # Each section starts with a ## line (except possibly the first chunk which is the file header)
-    section_pattern = re.compile(r"^(## .+)$", re.MULTILINE)
-    parts = section_pattern.split(content)
-
-    # parts alternates between: [pre-header text, header1, body1, header2, body2, ...]
-    if len(parts) < 3:
+    # Each section runs from its ## header to the next one (or end of file);
+    # the preamble before the first header is always kept
+    matches = list(_SECTION_RE.finditer(content))
+    if len(matches) < 2:
         # No ## headers found or only one section -- nothing to deduplicate
-        return content, fixes
+        return content, []
 
-    result_parts: list[str] = [parts[0]]  # Keep the preamble (before first ## header)
+    fixes: list[str] = []
     seen_headers: set[str] = set()
-
-    # Iterate over (header, body) pairs
-    i = 1
-    while i < len(parts) - 1:
-        header = parts[i]
-        body = parts[i + 1]
-        header_normalized = header.strip().lower()
+    buf = io.BytesIO()
+    buf.write(content[: matches[0].start()])
+
+    ends = [m.start() for m in matches[1:]]
+    ends.append(len(content))
+    for match, end in zip(matches, ends):
+        # Only the header line is decoded, for case-insensitive comparison
+        header = match.group(1).decode("utf-8").strip()
+        header_normalized = header.lower()
         if header_normalized in seen_headers:
-            fixes.append(f"Removed duplicate section: '{header.strip()}'")
+            fixes.append(f"Removed duplicate section: '{header}'")
         else:
             seen_headers.add(header_normalized)
-            result_parts.append(header)
-            result_parts.append(body)
-        i += 2
+            buf.write(content[match.start() : end])
 
-    # Handle trailing header without body (edge case)
-    if i < len(parts):
-        header = parts[i]
-        header_normalized = header.strip().lower()
-        if header_normalized not in seen_headers:
-            result_parts.append(header)
-
-    return "".join(result_parts), fixes
+    if not fixes:
+        return content, fixes
+    return buf.getvalue(), fixes
 
 
-def _ensure_required_sections(content: str, file_stem: str) -> tuple[str, list[str]]:
+def _ensure_required_sections(
+    content: bytes, file_stem: str
+) -> tuple[bytes, list[str]]:
     """Ensure all required sections exist in the file content.
 
     Missing sections are appended at the end of the file.
@@ -223,16 +283,127 @@ def _ensure_required_sections(content: str, file_stem: str) -> tuple[str, list[s
     if not required:
         return content, []
 
-    fixes: list[str] = []
-    for section_header in required:
-        if section_header not in content:
-            # Append the missing section at the end
-            content = (
-                content.rstrip("\n") + f"\n\n{section_header}\n\nNo entries yet.\n"
+    # Collect the headers actually present in one scan; a section only counts
+    # as present when it has its own header line
+    present = {
+        m.group(1).decode("utf-8").strip() for m in _SECTION_RE.finditer(content)
+    }
+
+    missing = [header for header in required if header not in present]
+    if not missing:
+        return content, []
+
+    # Append all missing sections at the end in a single concatenation
+    tail = "".join(f"\n\n{header}\n\nNo entries yet." for header in missing)
+    content = content.rstrip(b"\n") + tail.encode("utf-8") + b"\n"
+    return content, [f"Added missing section: '{header}'" for header in missing]
+
+
+def _repair_one(
+    stem: str,
+    path: Path,
+    project_root: Path,
+    timestamp: str,
+    stamp_entry: list[int] | None,
+    dry_run: bool,
+) -> FileRepairResult:
+    """Check and repair one memory file (steps 2-5 of repair_memory).
+
+    Args:
+        stem: Memory file stem (key into TEMPLATES and REQUIRED_SECTIONS)
+        path: Path to the memory file
+        project_root: Project root, for relative paths in actions
+        timestamp: Timestamp substituted into templates
+        stamp_entry: The file's known-good [mtime_ns, size] from the last run
+        dry_run: If True, report what would be fixed without modifying files
+
+    Returns:
+        FileRepairResult with the actions, errors and progress messages
+    """
+    result = FileRepairResult()
+    rel_path = str(path.relative_to(project_root))
+
+    if not path.exists():
+        template_content = TEMPLATES[stem].format(timestamp=timestamp)
+        result.actions.append(
+            RepairAction(
+                file=rel_path,
+                description="Created missing file from template",
+                severity="warning",
+            )
+        )
+        if not dry_run:
+            if not _write_file(path, template_content.encode("utf-8")):
+                result.unrecoverable.append(f"Cannot create {path}")
+                return result
+        result.messages.append(
+            f"{'[DRY-RUN] Would create' if dry_run else 'CREATED'}: {path}"
+        )
+        # File was just created from template -- no further repairs needed for this file
+        return result
+
+    # Skip files unchanged since they were last found healthy
+    try:
+        st = path.stat()
+        file_key = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        file_key = None
+    if file_key is not None and stamp_entry == file_key:
+        result.stamp = file_key
+        result.messages.append(f"OK: {path} (unchanged since last check)")
+        return result
+
+    # Step 3-5: Repair existing files
+    content = _read_file(path)
+    if not content.strip():
+        # File exists but is empty -- recreate from template
+        template_content = TEMPLATES[stem].format(timestamp=timestamp)
+        result.actions.append(
+            RepairAction(
+                file=rel_path,
+                description="Recreated empty file from template",
+                severity="warning",
+            )
+        )
+        if not dry_run:
+            _write_file(path, template_content.encode("utf-8"))
+        result.messages.append(
+            f"{'[DRY-RUN] Would recreate' if dry_run else 'RECREATED'}: {path} (was empty)"
+        )
+        return result
+
+    all_fixes: list[str] = []
+
+    # Step 3: Fix malformed headers
+    content, header_fixes = _fix_malformed_headers(content)
+    all_fixes.extend(header_fixes)
+
+    # Step 4: Remove duplicate sections
+    content, dup_fixes = _remove_duplicate_sections(content)
+    all_fixes.extend(dup_fixes)
+
+    # Step 5: Ensure required sections exist
+    content, section_fixes = _ensure_required_sections(content, stem)
+    all_fixes.extend(section_fixes)
+
+    # Write back if anything changed
+    if all_fixes:
+        for fix_desc in all_fixes:
+            result.actions.append(
+                RepairAction(file=rel_path, description=fix_desc, severity="info")
             )
-            fixes.append(f"Added missing section: '{section_header}'")
+        if not dry_run:
+            if not _write_file(path, content):
+                result.unrecoverable.append(f"Cannot write repaired content to {path}")
+        prefix = "[DRY-RUN] Would apply" if dry_run else "APPLIED"
+        result.messages.append(f"{prefix} {len(all_fixes)} fix(es) to {path}:")
+        result.messages.extend(f"  - {fix_desc}" for fix_desc in all_fixes)
+    else:
+        # Healthy as read -- remember it so the next run can skip it
+        result.stamp = file_key
+        result.messages.append(f"OK: {path} (no repairs needed)")
 
-    return content, fixes
+    return result
 
 
 def repair_memory(project_root: Path, dry_run: bool, verbose: bool) -> RepairReport:
@@ -245,6 +416,9 @@ def repair_memory(project_root: Path, dry_run: bool, verbose: bool) -> RepairRep
     4. Duplicate sections
     5. Missing required sections
 
+    The memory files are independent, so steps 2-5 run for all of them
+    concurrently; results are collected in file order.
+
     Args:
         project_root: Path to the project root directory containing design/memory/
         dry_run: If True, report what would be fixed without modifying files
@@ -275,88 +449,37 @@ def repair_memory(project_root: Path, dry_run: bool, verbose: bool) -> RepairRep
         if verbose:
             print(f"{'[DRY-RUN] Would create' if dry_run else 'CREATED'}: {memory_dir}")
 
-    # Step 2: Check and create missing memory files
+    stamp_path = memory_dir / STAMP_FILENAME
+    stamp = _load_stamp(stamp_path)
+    old_stamp = dict(stamp)
+
+    # Steps 2-5: Check, create, and repair each memory file
     file_map = {
         "activeContext": memory_dir / "activeContext.md",
         "progress": memory_dir / "progress.md",
         "patterns": memory_dir / "patterns.md",
     }
 
-    for stem, path in file_map.items():
-        if not path.exists():
-            template_content = TEMPLATES[stem].format(timestamp=timestamp)
-            report.actions.append(
-                RepairAction(
-                    file=str(path.relative_to(project_root)),
-                    description="Created missing file from template",
-                    severity="warning",
-                )
-            )
-            if not dry_run:
-                if not _write_file(path, template_content):
-                    report.unrecoverable.append(f"Cannot create {path}")
-                    continue
-            if verbose:
-                print(f"{'[DRY-RUN] Would create' if dry_run else 'CREATED'}: {path}")
-            # File was just created from template -- no further repairs needed for this file
-            continue
-
-        # Step 3-5: Repair existing files
-        content = _read_file(path)
-        if not content.strip():
-            # File exists but is empty -- recreate from template
-            template_content = TEMPLATES[stem].format(timestamp=timestamp)
-            report.actions.append(
-                RepairAction(
-                    file=str(path.relative_to(project_root)),
-                    description="Recreated empty file from template",
-                    severity="warning",
-                )
-            )
-            if not dry_run:
-                _write_file(path, template_content)
-            if verbose:
-                print(
-                    f"{'[DRY-RUN] Would recreate' if dry_run else 'RECREATED'}: {path} (was empty)"
-                )
-            continue
-
-        all_fixes: list[str] = []
-
-        # Step 3: Fix malformed headers
-        content, header_fixes = _fix_malformed_headers(content)
-        all_fixes.extend(header_fixes)
-
-        # Step 4: Remove duplicate sections
-        content, dup_fixes = _remove_duplicate_sections(content)
-        all_fixes.extend(dup_fixes)
-
-        # Step 5: Ensure required sections exist
-        content, section_fixes = _ensure_required_sections(content, stem)
-        all_fixes.extend(section_fixes)
-
-        # Write back if anything changed
-        if all_fixes:
-            for fix_desc in all_fixes:
-                report.actions.append(
-                    RepairAction(
-                        file=str(path.relative_to(project_root)),
-                        description=fix_desc,
-                        severity="info",
-                    )
-                )
-            if not dry_run:
-                if not _write_file(path, content):
-                    report.unrecoverable.append(
-                        f"Cannot write repaired content to {path}"
-                    )
+    with ThreadPoolExecutor(max_workers=len(file_map)) as executor:
+        results = executor.map(
+            lambda item: _repair_one(
+                item[0], item[1], project_root, timestamp, stamp.get(item[1].name), dry_run
+            ),
+            file_map.items(),
+        )
+        for path, result in zip(file_map.values(), results):
+            report.actions.extend(result.actions)
+            report.unrecoverable.extend(result.unrecoverable)
             if verbose:
-                prefix = "[DRY-RUN] Would apply" if dry_run else "APPLIED"
-                print(f"{prefix} {len(all_fixes)} fix(es) to {path}:")
-                for fix_desc in all_fixes:
-                    print(f"  - {fix_desc}")
-        elif verbose:
-            print(f"OK: {path} (no repairs needed)")
+                for message in result.messages:
+                    print(message)
+            if result.stamp is None:
+                stamp.pop(path.name, None)
+            else:
+                stamp[path.name] = result.stamp
+
+    if not dry_run and stamp != old_stamp:
+        _write_file(stamp_path, json.dumps(stamp).encode("utf-8"))
 
     return report
 
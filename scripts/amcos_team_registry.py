@@ -8,43 +8,91 @@ Creates, updates, and queries teams and their agent memberships.
 Usage:
     python amcos_team_registry.py create --team <name> --repo <url> [--project-board <url>]
     python amcos_team_registry.py add-agent --team <name> --agent-name <name> --role <role> --plugin <plugin> --host <host>
+    python amcos_team_registry.py add-agents --team <name> --from <agents.json>
     python amcos_team_registry.py remove-agent --team <name> --agent-name <name>
     python amcos_team_registry.py update-status --team <name> --agent-name <name> --status <status>
     python amcos_team_registry.py list [--team <name>]
+
+Environment:
+    AIMAESTRO_API           API base URL (default: http://localhost:23000)
+    AIMAESTRO_HTTP_BACKEND  Set to "httpx" to send requests through httpx
+                            (HTTP/2 with the h2 extra) when it is installed
 """
 
 import argparse
+import http.client
+import io
 import json
 import os
+import select
 import sys
-import urllib.error
-import urllib.request
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, NamedTuple
+from urllib.parse import urlsplit
 
 from amcos_output_utils import AmcosOutput
 
+try:
+    import orjson
+except ImportError:  # orjson is optional — fall back to stdlib json
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # ijson is optional — team lookups parse the full list
+    ijson = None  # type: ignore[assignment]
+
 # API base URL from environment, default to localhost
 API_BASE = os.environ.get("AIMAESTRO_API", "http://localhost:23000")
+API_TIMEOUT = 30
+
+# Requests reuse one keep-alive connection per thread, so consecutive calls in
+# a single command skip the TCP (and, for https, TLS) handshake
+_API_URL = urlsplit(API_BASE)
+_API_PREFIX = _API_URL.path.rstrip("/")
+
+# Request paths with API_BASE's path prefix folded in at import time
+_TEAMS_PATH = f"{_API_PREFIX}/api/teams"
+_TEAM_PATH = (_TEAMS_PATH + "/{}").format
+_AGENTS_PATH = (_TEAMS_PATH + "/{}/agents").format
+_AGENT_PATH = (_TEAMS_PATH + "/{}/agents/{}").format
+_CONNECTION_CLASS = (
+    http.client.HTTPSConnection
+    if _API_URL.scheme == "https"
+    else http.client.HTTPConnection
+)
+_HEADERS = {"Accept": "application/json", "User-Agent": "amcos-registry/1.0"}
+_JSON_HEADERS = {**_HEADERS, "Content-Type": "application/json"}
+_local = threading.local()
+
+# Body of the last GET /api/teams, reused until a mutating request is sent
+_teams_cache: dict[str, Any] | None = None
+# Name -> team index over _teams_cache, built on the first lookup by name
+_teams_by_name: dict[str, dict[str, Any]] | None = None
+
+# Gateway errors on idempotent requests are retried with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "HEAD", "DELETE"})
+_RETRY_TOTAL = 2
+_RETRY_BACKOFF = 0.2  # seconds, doubled on each retry
+
+# Upper bound on parallel requests (add-agents, per-team agent fetches); each
+# worker thread keeps its own keep-alive connection
+API_MAX_WORKERS = 8
 
 
 # Role constraints for team composition validation.
 # All worker roles map to governance role "member".
-class RoleConstraint:
+class RoleConstraint(NamedTuple):
     """Role constraint data."""
 
-    def __init__(
-        self,
-        min_count: int,
-        max_count: int,
-        plugin: str,
-        governance_role: str = "member",
-    ):
-        self.min = min_count
-        self.max = max_count
-        self.plugin = plugin
-        # Governance role used when registering the agent with the API
-        self.governance_role = governance_role
+    min: int
+    max: int
+    plugin: str
+    # Governance role used when registering the agent with the API
+    governance_role: str = "member"
 
 
 ROLE_CONSTRAINTS: dict[str, RoleConstraint] = {
@@ -57,59 +105,218 @@ ROLE_CONSTRAINTS: dict[str, RoleConstraint] = {
 
 def get_timestamp() -> str:
     """Get current ISO8601 timestamp."""
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Format the Z suffix directly instead of rewriting isoformat()'s offset
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _connection() -> http.client.HTTPConnection:
+    """Return this thread's connection to the API, creating it on first use."""
+    warming = getattr(_local, "warming", None)
+    if warming is not None:
+        # Let a background connect started by _warm_connection finish first
+        warming.join()
+        _local.warming = None
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _CONNECTION_CLASS(_API_URL.netloc, timeout=API_TIMEOUT)
+    elif conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+        # An idle keep-alive socket only turns readable once the server has
+        # closed it; reconnect instead of failing on the next request
+        conn.close()
+    return conn
+
+
+def _warm_connection() -> None:
+    """Start opening this thread's API connection in the background.
+
+    DNS lookup and the TCP (and TLS) handshake then overlap argument parsing
+    instead of delaying the first request. A failed connect is dropped; the
+    first request reconnects and reports the error.
+    """
+    if _HTTPX_CLIENT is not None:
+        return
+    conn = _connection()
+    if conn.sock is not None:
+        return
+
+    def connect() -> None:
+        try:
+            conn.connect()
+        except OSError:
+            conn.close()
+
+    _local.warming = threading.Thread(target=connect, daemon=True)
+    _local.warming.start()
+
+
+def _send_http_client(
+    method: str,
+    path: str,
+    data: bytes | None,
+    headers: dict[str, str],
+    stream: Any = None,
+) -> tuple[int, str, Any]:
+    """Send one request over this thread's http.client keep-alive connection."""
+    while True:
+        conn = _connection()
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+            if stream is not None and resp.status == 200:
+                try:
+                    return resp.status, resp.reason, stream(resp)
+                except BaseException:
+                    # The body may be only partly read; never reuse the socket
+                    conn.close()
+                    raise
+            return resp.status, resp.reason, resp.read()
+        except (http.client.HTTPException, OSError) as exc:
+            conn.close()
+            # A reused connection can still be dropped mid-request; replay
+            # idempotent requests once on a fresh one
+            if reused and method in _RETRY_METHODS and not isinstance(exc, TimeoutError):
+                continue
+            if isinstance(exc, OSError):
+                raise
+            raise ConnectionError(f"Invalid response from API: {exc!r}") from exc
+
+
+def _make_httpx_client() -> Any:
+    """Return a shared httpx client if AIMAESTRO_HTTP_BACKEND=httpx, else None.
+
+    HTTP/2 is enabled when the h2 package is installed, so parallel requests
+    share one connection. Returns None (http.client is used) when httpx is
+    not installed.
+    """
+    if os.environ.get("AIMAESTRO_HTTP_BACKEND", "").lower() != "httpx":
+        return None
+    try:
+        import httpx
+    except ImportError:  # httpx is optional — fall back to http.client
+        return None
+    try:
+        import h2  # noqa: F401  # HTTP/2 support is httpx's optional extra
+    except ImportError:
+        http2 = False
+    else:
+        http2 = True
+    return httpx.Client(
+        base_url=f"{_API_URL.scheme}://{_API_URL.netloc}",
+        http2=http2,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=API_TIMEOUT,
+    )
 
 
-def _api_url(path: str) -> str:
-    """Build full API URL from a relative path."""
-    return f"{API_BASE}{path}"
+_HTTPX_CLIENT = _make_httpx_client()
 
 
-def _make_request(
-    url: str,
+def _send_httpx(
     method: str,
+    path: str,
+    data: bytes | None,
+    headers: dict[str, str],
+    stream: Any = None,
+) -> tuple[int, str, Any]:
+    """Send one request through the shared httpx client.
+
+    The body is read in full; a stream callback gets it as an in-memory file.
+    """
+    import httpx
+
+    try:
+        resp = _HTTPX_CLIENT.request(method, path, content=data, headers=headers)
+    except httpx.TimeoutException as exc:
+        raise TimeoutError(str(exc)) from exc
+    except httpx.TransportError as exc:
+        raise ConnectionError(str(exc)) from exc
+    if stream is not None and resp.status_code == 200:
+        return resp.status_code, resp.reason_phrase, stream(io.BytesIO(resp.content))
+    return resp.status_code, resp.reason_phrase, resp.content
+
+
+_send = _send_http_client if _HTTPX_CLIENT is None else _send_httpx
+
+
+def _request(
+    method: str,
+    path: str,
     body: dict[str, Any] | None = None,
-    timeout: int = 30,
-) -> Any:
-    """Build and send an HTTP request via urllib, returning the response object."""
-    headers: dict[str, str] = {"Accept": "application/json"}
+    stream: Any = None,
+) -> tuple[int, str, Any]:
+    """Send a request to the API and return (status, reason, body bytes).
+
+    path is the full request path, including any API_BASE path prefix. If
+    stream is given, a 200 response is passed to stream(response) as a binary
+    file object instead of being read, and its return value replaces the body
+    bytes. stream must read the body to the end.
+
+    Raises:
+        OSError: If the API cannot be reached or the connection fails.
+    """
+    headers = _HEADERS
     data: bytes | None = None
     if body is not None:
         # Encode JSON body and set content-type header
-        data = json.dumps(body).encode("utf-8")
-        headers["Content-Type"] = "application/json"
-    req = urllib.request.Request(url, data=data, headers=headers, method=method)
-    # urlopen raises HTTPError for 4xx/5xx, which we catch at the call sites
-    return urllib.request.urlopen(req, timeout=timeout)  # type: ignore[return-value]
-
-
-def _handle_urllib_response(
-    resp: Any, status_code: int, _context: str
+        data = _json_bytes(body)
+        headers = _JSON_HEADERS
+    retry = method in _RETRY_METHODS
+    attempt = 0
+    while True:
+        status, reason, raw = _send(method, path, data, headers, stream)
+        if status in _RETRY_STATUSES and retry and attempt < _RETRY_TOTAL:
+            time.sleep(_RETRY_BACKOFF * 2**attempt)
+            attempt += 1
+            continue
+        return status, reason, raw
+
+
+def _handle_response(
+    status: int, reason: str, raw: bytes, context: str
 ) -> dict[str, Any]:
-    """Parse a successful urllib response body into a dict."""
+    """Parse a response body into a dict, raising RuntimeError on HTTP errors."""
+    if status >= 400:
+        try:
+            body = _json_loads(raw) if raw else {}
+            detail = body.get("error") or body.get("detail") or body.get("message")
+            if not detail:
+                # Quote the body as received instead of re-serializing it
+                detail = raw[:512].decode("utf-8", "replace") or reason
+        except Exception:
+            detail = reason or f"HTTP Error {status}"
+        raise RuntimeError(f"{context}: HTTP {status} - {detail}")
     # Some endpoints return empty body on success (e.g. DELETE 204)
-    if status_code == 204:
-        return {}
-    raw = resp.read()
-    if not raw:
+    if status == 204 or not raw:
         return {}
-    return json.loads(raw.decode("utf-8"))
+    return _json_loads(raw)
 
 
-def _handle_http_error(exc: urllib.error.HTTPError, context: str) -> dict[str, Any]:
-    """Extract error detail from an HTTPError and raise RuntimeError."""
-    try:
-        raw = exc.read()
-        body = json.loads(raw.decode("utf-8")) if raw else {}
-        detail = (
-            body.get("error")
-            or body.get("detail")
-            or body.get("message")
-            or json.dumps(body)
-        )
-    except Exception:
-        detail = exc.reason or str(exc)
-    raise RuntimeError(f"{context}: HTTP {exc.code} - {detail}")
+def _call(
+    method: str, path: str, context: str, body: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Send an API request and return the parsed response body.
+
+    Any request other than GET invalidates the cached team list.
+    """
+    global _teams_cache, _teams_by_name
+    if method != "GET":
+        _teams_cache = _teams_by_name = None
+    return _handle_response(*_request(method, path, body), context)
 
 
 def validate_team_name(name: str) -> tuple[bool, str]:
@@ -117,8 +324,9 @@ def validate_team_name(name: str) -> tuple[bool, str]:
     if not name.endswith("-team"):
         return False, "Team name must end with '-team'"
 
-    parts = name.rsplit("-", 2)
-    if len(parts) < 3:
+    # Another hyphen before the "-team" suffix; same as rsplit("-", 2) giving
+    # three parts, without building the list
+    if name.find("-", 0, -5) < 0:
         return False, "Team name must be: <repo-name>-<project-type>-team"
 
     return True, "Valid"
@@ -141,144 +349,301 @@ def create_team(
     if project_board_url:
         payload["github_project"] = project_board_url
 
-    url = _api_url("/api/teams")
-    try:
-        resp = _make_request(url, "POST", body=payload)
-        return _handle_urllib_response(resp, resp.status, f"Create team '{team_name}'")
-    except urllib.error.HTTPError as exc:
-        return _handle_http_error(exc, f"Create team '{team_name}'")
+    return _call("POST", _TEAMS_PATH, f"Create team '{team_name}'", payload)
 
 
-def add_agent(
-    team_id: str,
+def _agent_payload(
     agent_name: str,
     role: str,
     plugin: str,
     host: str,
     ai_maestro_address: str | None = None,
 ) -> dict[str, Any]:
-    """Add an agent to a team via the AI Maestro REST API."""
+    """Validate an agent's role and plugin and build its registration payload."""
     # Validate role locally
-    if role not in ROLE_CONSTRAINTS:
+    constraint = ROLE_CONSTRAINTS.get(role)
+    if constraint is None:
         raise ValueError(
             f"Invalid role: {role}. Valid roles: {list(ROLE_CONSTRAINTS.keys())}"
         )
 
     # Check plugin matches role
-    expected_plugin = ROLE_CONSTRAINTS[role].plugin
-    if plugin != expected_plugin:
+    if plugin != constraint.plugin:
         raise ValueError(
-            f"Role '{role}' requires plugin '{expected_plugin}', got '{plugin}'"
+            f"Role '{role}' requires plugin '{constraint.plugin}', got '{plugin}'"
         )
 
     # Default AI Maestro address to agent name
     if ai_maestro_address is None:
         ai_maestro_address = agent_name
 
-    payload = {
+    return {
         "name": agent_name,
         "role": role,
-        "governance_role": ROLE_CONSTRAINTS[role].governance_role,
+        "governance_role": constraint.governance_role,
         "plugin": plugin,
         "host": host,
         "ai_maestro_address": ai_maestro_address,
         "status": "active",
     }
 
-    url = _api_url(f"/api/teams/{team_id}/agents")
-    try:
-        resp = _make_request(url, "POST", body=payload)
-        return _handle_urllib_response(
-            resp, resp.status, f"Add agent '{agent_name}' to team '{team_id}'"
+
+def _post_agent(team_id: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """POST one agent payload to a team."""
+    return _call(
+        "POST",
+        _AGENTS_PATH(team_id),
+        f"Add agent '{payload['name']}' to team '{team_id}'",
+        payload,
+    )
+
+
+def add_agent(
+    team_id: str,
+    agent_name: str,
+    role: str,
+    plugin: str,
+    host: str,
+    ai_maestro_address: str | None = None,
+) -> dict[str, Any]:
+    """Add an agent to a team via the AI Maestro REST API."""
+    payload = _agent_payload(agent_name, role, plugin, host, ai_maestro_address)
+    return _post_agent(team_id, payload)
+
+
+def add_agents_bulk(
+    team_id: str, agents: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Add several agents to a team, sending the requests in parallel.
+
+    Every entry is validated before any request is sent. Entries are dicts
+    with name, role, plugin and host keys and an optional address.
+
+    Returns:
+        The API response for each agent, in input order.
+
+    Raises:
+        ValueError: If an entry is malformed or fails validation.
+        RuntimeError: If any agent was rejected or could not be sent; the
+            others are still added and named in the message.
+    """
+    payloads = []
+    for index, agent in enumerate(agents):
+        if not isinstance(agent, dict):
+            raise ValueError(f"Agent entry {index} is not an object")
+        for key in ("name", "role", "plugin", "host"):
+            if key not in agent:
+                raise ValueError(f"Agent entry {index} is missing '{key}'")
+        payloads.append(
+            _agent_payload(
+                agent["name"],
+                agent["role"],
+                agent["plugin"],
+                agent["host"],
+                agent.get("address"),
+            )
         )
-    except urllib.error.HTTPError as exc:
-        return _handle_http_error(exc, f"Add agent '{agent_name}' to team '{team_id}'")
+    if not payloads:
+        return []
+
+    # Imported here so commands that never fan out skip its import cost
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(
+        max_workers=min(API_MAX_WORKERS, len(payloads))
+    ) as pool:
+        futures = [pool.submit(_post_agent, team_id, p) for p in payloads]
+
+    results: list[dict[str, Any]] = []
+    added: list[str] = []
+    errors: list[str] = []
+    for payload, future in zip(payloads, futures):
+        try:
+            results.append(future.result())
+            added.append(payload["name"])
+        except RuntimeError as exc:
+            errors.append(str(exc))
+        except OSError as exc:
+            # Transport failure for this agent only; the others may have landed
+            errors.append(f"Add agent '{payload['name']}' to team '{team_id}': {exc}")
+    if errors:
+        raise RuntimeError(
+            f"{len(errors)} of {len(payloads)} agent(s) not added"
+            f" (added: {', '.join(added) or 'none'}): "
+            + "; ".join(errors)
+        )
+    return results
 
 
 def remove_agent(team_id: str, agent_id: str) -> dict[str, Any]:
     """Remove an agent from a team via the AI Maestro REST API."""
-    url = _api_url(f"/api/teams/{team_id}/agents/{agent_id}")
-    context = f"Remove agent '{agent_id}' from team '{team_id}'"
-    try:
-        resp = _make_request(url, "DELETE")
-        return _handle_urllib_response(resp, resp.status, context)
-    except urllib.error.HTTPError as exc:
-        return _handle_http_error(exc, context)
+    return _call(
+        "DELETE",
+        _AGENT_PATH(team_id, agent_id),
+        f"Remove agent '{agent_id}' from team '{team_id}'",
+    )
 
 
 def update_team(team_id: str, updates: dict[str, Any]) -> dict[str, Any]:
     """Update a team via the AI Maestro REST API."""
-    url = _api_url(f"/api/teams/{team_id}")
-    context = f"Update team '{team_id}'"
-    try:
-        resp = _make_request(url, "PATCH", body=updates)
-        return _handle_urllib_response(resp, resp.status, context)
-    except urllib.error.HTTPError as exc:
-        return _handle_http_error(exc, context)
+    return _call("PATCH", _TEAM_PATH(team_id), f"Update team '{team_id}'", updates)
 
 
 def list_teams() -> dict[str, Any]:
-    """List all teams via the AI Maestro REST API."""
-    url = _api_url("/api/teams")
-    context = "List teams"
-    try:
-        resp = _make_request(url, "GET")
-        return _handle_urllib_response(resp, resp.status, context)
-    except urllib.error.HTTPError as exc:
-        return _handle_http_error(exc, context)
-
-
-def get_team_by_name(team_name: str) -> dict[str, Any] | None:
-    """Find a team by name from the API. Returns the team dict or None."""
-    data = list_teams()
-    teams = data.get("teams", [])
-    for team in teams:
+    """List all teams via the AI Maestro REST API.
+
+    The response is fetched at most once per process until a create, add,
+    remove, or update request changes the registry.
+    """
+    global _teams_cache
+    if _teams_cache is None:
+        _teams_cache = _call("GET", _TEAMS_PATH, "List teams")
+    return _teams_cache
+
+
+def _stream_team(team_name: str) -> dict[str, Any] | None:
+    """Find a team by name while GET /api/teams is still being received.
+
+    Teams are parsed one at a time with ijson and only the match is kept, so
+    the full list is never held in memory. The rest of the body is drained
+    to keep the connection reusable.
+    """
+
+    def find(resp: Any) -> dict[str, Any] | None:
+        match = None
+        for team in ijson.items(resp, "teams.item", use_float=True):
+            if team.get("name") == team_name:
+                match = team
+                break
+        while resp.read(65536):
+            pass
+        return match
+
+    status, reason, result = _request("GET", _TEAMS_PATH, stream=find)
+    if status == 200:
+        return result
+    data = _handle_response(status, reason, result, "List teams")
+    for team in data.get("teams", []):
         if team.get("name") == team_name:
             return team
     return None
 
 
+def get_team_by_name(team_name: str) -> dict[str, Any] | None:
+    """Find a team by name from the API. Returns the team dict or None.
+
+    With ijson installed and no team list fetched yet, the list is streamed
+    and only the matching team is parsed into memory; such lookups are not
+    cached.
+    """
+    global _teams_by_name
+    if _teams_by_name is None:
+        if _teams_cache is None and ijson is not None:
+            return _stream_team(team_name)
+        data = list_teams()
+        # The first team with a given name wins, as with a linear scan
+        by_name: dict[str, dict[str, Any]] = {}
+        for team in data.get("teams", []):
+            by_name.setdefault(team.get("name"), team)
+        _teams_by_name = by_name
+    return _teams_by_name.get(team_name)
+
+
+def _team_id(team: dict[str, Any]) -> str:
+    """Return a team's API id."""
+    # The API may use 'id', '_id', or 'name' as identifier
+    return str(team.get("id") or team.get("_id") or team["name"])
+
+
 def _resolve_team_id(team_name: str) -> str:
     """Resolve a team name to its API id. Raises if not found."""
     team = get_team_by_name(team_name)
     if team is None:
         raise ValueError(f"Team '{team_name}' not found")
-    # The API may use 'id', '_id', or 'name' as identifier
-    return str(team.get("id") or team.get("_id") or team["name"])
+    return _team_id(team)
 
 
 def _resolve_agent_id(team: dict[str, Any], agent_name: str) -> str:
-    """Resolve an agent name to its API id within a team. Raises if not found."""
-    agents = team.get("agents", [])
-    for agent in agents:
-        if agent.get("name") == agent_name:
-            return str(agent.get("id") or agent.get("_id") or agent["name"])
-    raise ValueError(
-        f"Agent '{agent_name}' not found in team '{team.get('name', '?')}'"
-    )
+    """Resolve an agent name to its API id within a team. Raises if not found.
+
+    The team's agents are indexed by name on first use and the index is kept
+    on the team dict, so repeated lookups in the same team are O(1).
+    """
+    by_name = team.get("_agents_by_name")
+    if by_name is None:
+        by_name = {}
+        # The first agent with a given name wins, as with a linear scan
+        for agent in team.get("agents", []):
+            by_name.setdefault(agent.get("name"), agent)
+        team["_agents_by_name"] = by_name
+    agent = by_name.get(agent_name)
+    if agent is None:
+        raise ValueError(
+            f"Agent '{agent_name}' not found in team '{team.get('name', '?')}'"
+        )
+    return str(agent.get("id") or agent.get("_id") or agent["name"])
 
 
-def format_team_list(team: dict[str, Any]) -> str:
-    """Format a single team's agents as a readable list."""
-    lines = []
-    team_name = team.get("name", "unknown")
-    lines.append(f"Team: {team_name}")
-    lines.append(f"Repository: {team.get('repository', 'N/A')}")
-    lines.append("")
-    lines.append("Agents:")
-    lines.append("-" * 80)
-    lines.append(f"{'Name':<25} {'Role':<15} {'Host':<20} {'Status':<10}")
-    lines.append("-" * 80)
-
-    for agent in team.get("agents", []):
-        lines.append(
-            f"{agent.get('name', '?'):<25} {agent.get('role', '?'):<15} "
-            f"{agent.get('host', '?'):<20} {agent.get('status', '?'):<10}"
+def _fetch_team_agents(team: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """Fetch a team's agent list, or None if the API does not return one."""
+    try:
+        data: Any = _call(
+            "GET",
+            _AGENTS_PATH(_team_id(team)),
+            f"List agents of team '{team.get('name', '?')}'",
         )
+    except RuntimeError:
+        return None
+    # Accept either a bare list or {"agents": [...]}
+    agents = data.get("agents") if isinstance(data, dict) else data
+    return agents if isinstance(agents, list) else None
+
+
+def fill_missing_agents(teams: list[dict[str, Any]]) -> None:
+    """Fetch agents for teams listed without them, in parallel and in place.
+
+    Teams whose agents cannot be fetched are left unchanged.
+    """
+    missing = [team for team in teams if "agents" not in team]
+    if not missing:
+        return
+    from concurrent.futures import ThreadPoolExecutor  # only needed here
+
+    with ThreadPoolExecutor(max_workers=min(API_MAX_WORKERS, len(missing))) as pool:
+        fetched = list(pool.map(_fetch_team_agents, missing))
+    for team, agents in zip(missing, fetched):
+        if agents is not None:
+            team["agents"] = agents
+            team.pop("_agents_by_name", None)
+
+
+# Agent table layout shared by every team block: (heading, column width).
+# The row template is generated from it once, with the widths baked in as
+# literal format specs, and bound as a str.format method
+_COLUMNS = (("Name", 25), ("Role", 15), ("Host", 20), ("Status", 10))
+_RULE = "-" * 80
+_ROW = (" ".join(f"{{:<{width}}}" for _, width in _COLUMNS) + "\n").format
+_AGENTS_HEADER = (
+    f"\nAgents:\n{_RULE}\n{_ROW(*(heading for heading, _ in _COLUMNS))}{_RULE}\n"
+)
+
+
+def _write_team(w: Any, team: dict[str, Any]) -> None:
+    """Write one team block (without a trailing newline) via the write callable w."""
+    w(f"Team: {team.get('name', 'unknown')}\n")
+    w(f"Repository: {team.get('repository', 'N/A')}\n")
+    w(_AGENTS_HEADER)
+    for agent in team.get("agents", []):
+        g = agent.get
+        w(_ROW(g("name", "?"), g("role", "?"), g("host", "?"), g("status", "?")))
+    w(f"\nLast Updated: {team.get('contacts_last_updated', 'N/A')}")
+
 
-    lines.append("")
-    lines.append(f"Last Updated: {team.get('contacts_last_updated', 'N/A')}")
-    return "\n".join(lines)
+def format_team_list(team: dict[str, Any]) -> str:
+    """Format a single team's agents as a readable list."""
+    buf = io.StringIO()
+    _write_team(buf.write, team)
+    return buf.getvalue()
 
 
 def format_all_teams(data: dict[str, Any]) -> str:
@@ -287,14 +652,19 @@ def format_all_teams(data: dict[str, Any]) -> str:
     if not teams:
         return "No teams registered."
 
-    lines = []
-    for team in teams:
-        lines.append(format_team_list(team))
-        lines.append("")
-    return "\n".join(lines)
+    buf = io.StringIO()
+    w = buf.write
+    for i, team in enumerate(teams):
+        # Teams are separated by a blank line
+        if i:
+            w("\n")
+        _write_team(w, team)
+        w("\n")
+    return buf.getvalue()
 
 
 def main() -> int:
+    _warm_connection()
     out = AmcosOutput("amcos_team_registry")
     parser = argparse.ArgumentParser(
         description="AMCOS Team Registry Manager (REST API)",
@@ -311,6 +681,11 @@ Examples:
         --agent-name svgbbox-programmer-001 --role programmer \\
         --plugin ai-maestro-programmer-agent --host macbook-dev-01
 
+    # Add several agents from a JSON list of
+    # {"name", "role", "plugin", "host", "address"?} objects
+    python amcos_team_registry.py add-agents --team svgbbox-library-team \\
+        --from agents.json
+
     # Remove an agent
     python amcos_team_registry.py remove-agent --team svgbbox-library-team \\
         --agent-name svgbbox-programmer-001
@@ -346,6 +721,18 @@ Examples:
         "--address", help="AI Maestro address (default: agent name)"
     )
 
+    # Add agents command
+    add_many_parser = subparsers.add_parser(
+        "add-agents", help="Add several agents to team from a JSON file"
+    )
+    add_many_parser.add_argument("--team", required=True, help="Team name")
+    add_many_parser.add_argument(
+        "--from",
+        dest="from_file",
+        required=True,
+        help="JSON file with a list of agent objects",
+    )
+
     # Remove agent command
     remove_parser = subparsers.add_parser("remove-agent", help="Remove agent from team")
     remove_parser.add_argument("--team", required=True, help="Team name")
@@ -370,7 +757,7 @@ Examples:
             result = create_team(args.team, args.repo, args.project_board)
             out.log(f"Created team: {args.team}")
             out.log_json(result, label="create")
-            print(json.dumps(result, separators=(",", ":")))
+            print(_json_bytes(result).decode("utf-8"))
             out.summary("DONE", f"Team '{args.team}' created")
             out.close()
             return 0
@@ -387,16 +774,34 @@ Examples:
             )
             out.log(f"Added agent '{args.agent_name}' to team '{args.team}'")
             out.log_json(result, label="add-agent")
-            print(json.dumps(result, separators=(",", ":")))
+            print(_json_bytes(result).decode("utf-8"))
             out.summary("DONE", f"Agent '{args.agent_name}' added to '{args.team}'")
             out.close()
             return 0
 
+        elif args.command == "add-agents":
+            # Read errors must not reach the OSError handler for API failures
+            try:
+                with open(args.from_file, encoding="utf-8") as f:
+                    agents = json.load(f)
+            except OSError as exc:
+                raise ValueError(f"Cannot read {args.from_file}: {exc}") from exc
+            if not isinstance(agents, list):
+                raise ValueError(f"{args.from_file}: expected a JSON list of agents")
+            team_id = _resolve_team_id(args.team)
+            results = add_agents_bulk(team_id, agents)
+            out.log(f"Added {len(results)} agent(s) to team '{args.team}'")
+            out.log_json(results, label="add-agents")
+            print(_json_bytes(results).decode("utf-8"))
+            out.summary("DONE", f"{len(results)} agent(s) added to '{args.team}'")
+            out.close()
+            return 0
+
         elif args.command == "remove-agent":
             team = get_team_by_name(args.team)
             if team is None:
                 raise ValueError(f"Team '{args.team}' not found")
-            team_id = str(team.get("id") or team.get("_id") or team["name"])
+            team_id = _team_id(team)
             agent_id = _resolve_agent_id(team, args.agent_name)
             remove_agent(team_id, agent_id)
             out.log(f"Removed agent '{args.agent_name}' from team '{args.team}'")
@@ -408,7 +813,7 @@ Examples:
             team = get_team_by_name(args.team)
             if team is None:
                 raise ValueError(f"Team '{args.team}' not found")
-            team_id = str(team.get("id") or team.get("_id") or team["name"])
+            team_id = _team_id(team)
 
             valid_statuses = ["active", "hibernated", "offline", "terminated"]
             if args.status not in valid_statuses:
@@ -419,17 +824,12 @@ Examples:
             # Use PATCH on the team to update the agent's status
             agent_id = _resolve_agent_id(team, args.agent_name)
             # Update via the team agents endpoint - PATCH the agent within the team
-            patch_url = _api_url(f"/api/teams/{team_id}/agents/{agent_id}")
-            patch_ctx = f"Update status of '{args.agent_name}'"
-            try:
-                patch_resp = _make_request(
-                    patch_url,
-                    "PATCH",
-                    body={"status": args.status, "status_updated_at": get_timestamp()},
-                )
-                _handle_urllib_response(patch_resp, patch_resp.status, patch_ctx)
-            except urllib.error.HTTPError as exc:
-                _handle_http_error(exc, patch_ctx)
+            _call(
+                "PATCH",
+                _AGENT_PATH(team_id, agent_id),
+                f"Update status of '{args.agent_name}'",
+                {"status": args.status, "status_updated_at": get_timestamp()},
+            )
             out.log(f"Updated '{args.agent_name}' status to '{args.status}'")
             out.summary("DONE", f"Agent '{args.agent_name}' status -> '{args.status}'")
             out.close()
@@ -440,19 +840,19 @@ Examples:
                 team = get_team_by_name(args.team)
                 if team is None:
                     raise ValueError(f"Team '{args.team}' not found")
+                fill_missing_agents([team])
                 out.log(format_team_list(team))
             else:
                 data = list_teams()
+                fill_missing_agents(data.get("teams", []))
                 out.log(format_all_teams(data))
             out.summary("DONE", "Team listing complete")
             out.close()
             return 0
 
-    except urllib.error.URLError as e:
-        # URLError covers connection failures (including timeouts via socket.timeout)
-        out.log(
-            f"Error: Cannot connect to AI Maestro API at {API_BASE}: {e.reason}"
-        )
+    except OSError as e:
+        # Connection failures, including timeouts (TimeoutError)
+        out.log(f"Error: Cannot connect to AI Maestro API at {API_BASE}: {e}")
         out.close()
         return 1
     except Exception as e: